@@ -1,18 +1,26 @@
 import os
 import sys
 import json
+import re
 import time
+import errno
 import socket
+import queue
+import select
+import selectors
 import threading
 import subprocess
 import shutil
-from urllib.parse import urlparse
-import webbrowser
+import stat
+import functools
+import operator
+from urllib.parse import urlparse, urlsplit
+import importlib.util
 import sqlite3
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog as fd
 from http.client import HTTPConnection
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 try:
@@ -22,17 +30,44 @@ except ImportError:
     HAS_PSUTIL = False
 
 try:
-    from pystray import Icon, Menu, MenuItem  # type: ignore
-    from PIL import Image, ImageDraw  # type: ignore
-    HAS_TRAY = True
+    import orjson  # type: ignore
+    HAS_ORJSON = True
 except ImportError:
-    HAS_TRAY = False
+    HAS_ORJSON = False
+
+# Tray deps are only probed here; they are imported when the tray icon is set up
+HAS_TRAY = (importlib.util.find_spec("pystray") is not None
+            and importlib.util.find_spec("PIL") is not None)
+# Linux notifications go straight over D-Bus when jeepney is installed (imported on first use)
+HAS_JEEPNEY = importlib.util.find_spec("jeepney") is not None
+# Docker SDK talks to the daemon socket directly; the docker CLI is the fallback
+HAS_DOCKER_SDK = importlib.util.find_spec("docker") is not None
+
+# Fast path for config (de)serialization; all values are plain scalars
+if HAS_ORJSON:
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+    def _json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    def _json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    _json_loads = json.loads
 
 # =========================
 # OS detection
 # =========================
 IS_WINDOWS = os.name == "nt"
 IS_MACOS = sys.platform == "darwin"
+IS_LINUX = sys.platform.startswith("linux")
+
+# Windows: venv\Scripts\..., Linux/macOS: venv/bin/...
+_VENV_BIN_NAME = "Scripts" if IS_WINDOWS else "bin"
+_PY_BASENAME = "python.exe" if IS_WINDOWS else "python"
+_CELERY_BASENAME = "celery.exe" if IS_WINDOWS else "celery"
+_DAPHNE_BASENAME = "daphne.exe" if IS_WINDOWS else "daphne"
 
 # =========================
 # Auto-detect common tools on macOS/Linux
@@ -82,6 +117,47 @@ def get_default_docker():
         # Linux
         return auto_detect_tool("docker", ["/usr/bin/docker"])
 
+def _dir_names(path):
+    """Names of the entries in directory path (empty if it can't be read); one scandir instead of a stat per file."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return frozenset()
+    # A directory's mtime changes whenever an entry is added, removed or renamed
+    return _scan_dir(path, mtime_ns)
+
+def _probe_exec(path) -> str | None:
+    """One stat: None if path is a runnable file, otherwise what's wrong with it."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return "not found"
+    except OSError as e:
+        return f"not accessible ({e.strerror})"
+    if stat.S_ISDIR(st.st_mode):
+        return "is a directory"
+    # Windows has no execute bit worth checking
+    if not IS_WINDOWS and not st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+        return "not executable"
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _find_terminal():
+    """Path of the first installed Linux terminal emulator, or None; looked up once."""
+    for term in ('gnome-terminal', 'xterm', 'konsole', 'xfce4-terminal'):
+        path = shutil.which(term)
+        if path:
+            return path
+    return None
+
+@functools.lru_cache(maxsize=64)
+def _scan_dir(path, mtime_ns):
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
 # =========================
 # DEFAULTS (used if no config file present)
 # =========================
@@ -120,6 +196,12 @@ DEFAULTS = {
     # "manual" = user clicks "Run Migrations"
     # "always" = run migrations before every backend start
     "MIGRATION_POLICY": "manual",
+
+    # Where child process output goes
+    # "ui" = stream into the log panel
+    # "file" = append to <config dir>/logs/<service>.log (no reader thread)
+    # "null" = discard
+    "LOG_SINK": "ui",
     
     # Docker resource limits
     "DOCKER_MEMORY_LIMIT": "512m",  # Memory limit for Docker containers
@@ -139,12 +221,23 @@ def get_config_path():
     return os.path.join(config_dir, 'launchpad.db')
 
 CONFIG_DB_PATH = get_config_path()
+LOG_DIR = os.path.join(os.path.dirname(CONFIG_DB_PATH), "logs")
+LOG_ROTATE_BYTES = 5 * 1024 * 1024  # roll <service>.log over to .log.1 past this size
+LOG_DRAIN_MS = 50        # how often the UI moves queued log lines into the tabs
+LOG_DRAIN_BATCH = 2000   # at most this many lines per pass, so a flood can't stall Tk
+LOG_EXPORT_CHUNK_LINES = 5000  # lines copied out of the widget per write when exporting
+
+# Persisted config keys, and a single C-level getter that pulls them off a Paths
+_PATHS_KEYS = tuple(DEFAULTS)
+_PATHS_GETTER = operator.attrgetter(*_PATHS_KEYS)
+# String-valued keys are stored as plain TEXT; everything else is JSON-encoded
+_STR_KEYS = frozenset(k for k, v in DEFAULTS.items() if isinstance(v, str))
 
 
 # =========================
 # Config data model
 # =========================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Paths:
     # Paths
     PROJECT_ROOT: str
@@ -178,74 +271,158 @@ class Paths:
 
     # Migrations
     MIGRATION_POLICY: str  # "manual" | "always"
+
+    # Process output
+    LOG_SINK: str  # "ui" | "file" | "null"
     
     # Docker
     DOCKER_MEMORY_LIMIT: str
     DOCKER_CPU_LIMIT: float
 
-    # ----- Derived paths & URLs -----
-    @property
-    def VENV_DIR(self):
-        return os.path.join(self.PROJECT_ROOT, "venv")
-
-    @property
-    def _venv_bin(self):
-        # Windows: venv\Scripts\..., Linux/macOS: venv/bin/...
-        if IS_WINDOWS:
-            return os.path.join(self.VENV_DIR, "Scripts")
-        return os.path.join(self.VENV_DIR, "bin")
-
-    @property
-    def PYTHON_EXE(self):
-        return os.path.join(self._venv_bin, "python.exe" if IS_WINDOWS else "python")
-
-    @property
-    def CELERY_EXE(self):
-        return os.path.join(self._venv_bin, "celery.exe" if IS_WINDOWS else "celery")
-
-    @property
-    def DAPHNE_EXE(self):
-        return os.path.join(self._venv_bin, "daphne.exe" if IS_WINDOWS else "daphne")
-
-    @property
-    def OPENAPI_URL(self):
-        return f"http://{self.DAPHNE_HOST}:{self.DAPHNE_PORT}{self._normalized_rel(self.OPENAPI_REL)}"
-
-    @property
-    def FRONTEND_URL(self):
-        return f"http://{self.FRONTEND_HOST}:{self.FRONTEND_PORT}"
-
-    @property
-    def CELERY_BEAT_SCHEDULE_PATH(self):
-        return os.path.join(self.PROJECT_ROOT, "celerybeat-schedule")
+    # ----- Derived paths & URLs (computed once in __post_init__) -----
+    VENV_DIR: str = field(init=False, repr=False, compare=False)
+    _venv_bin: str = field(init=False, repr=False, compare=False)
+    PYTHON_EXE: str = field(init=False, repr=False, compare=False)
+    CELERY_EXE: str = field(init=False, repr=False, compare=False)
+    DAPHNE_EXE: str = field(init=False, repr=False, compare=False)
+    OPENAPI_URL: str = field(init=False, repr=False, compare=False)
+    FRONTEND_URL: str = field(init=False, repr=False, compare=False)
+    CELERY_BEAT_SCHEDULE_PATH: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen instance: derived values have to go through object.__setattr__
+        set_ = functools.partial(object.__setattr__, self)
+
+        venv_dir = os.path.join(self.PROJECT_ROOT, "venv")
+        venv_bin = os.path.join(venv_dir, _VENV_BIN_NAME)
+        set_("VENV_DIR", venv_dir)
+        set_("_venv_bin", venv_bin)
+        set_("PYTHON_EXE", os.path.join(venv_bin, _PY_BASENAME))
+        set_("CELERY_EXE", os.path.join(venv_bin, _CELERY_BASENAME))
+        set_("DAPHNE_EXE", os.path.join(venv_bin, _DAPHNE_BASENAME))
+
+        rel = self.OPENAPI_REL
+        if not rel:
+            rel = "/"
+        elif not rel.startswith("/"):
+            rel = "/" + rel
+        set_("OPENAPI_URL", f"http://{self.DAPHNE_HOST}:{self.DAPHNE_PORT}{rel}")
+        set_("FRONTEND_URL", f"http://{self.FRONTEND_HOST}:{self.FRONTEND_PORT}")
+        set_("CELERY_BEAT_SCHEDULE_PATH", os.path.join(self.PROJECT_ROOT, "celerybeat-schedule"))
+
+
+def _validate_paths(cfg: Paths) -> list[str]:
+    """Problems with cfg's project/frontend/npm paths; empty when everything is in place.
+
+    One listing per directory (cached by mtime, see _dir_names) plus one stat for npm;
+    the directories themselves are only stat'ed to explain a miss.
+    """
+    errs = []
+    bin_names = _dir_names(cfg._venv_bin)
+    if _PY_BASENAME not in bin_names and not os.path.isdir(cfg.PROJECT_ROOT):
+        errs.append(f"PROJECT_ROOT not found: {cfg.PROJECT_ROOT}")
+    else:
+        if _PY_BASENAME not in bin_names:
+            errs.append(f"Python venv not found: {cfg.PYTHON_EXE} (expected under PROJECT_ROOT/venv)")
+        if _CELERY_BASENAME not in bin_names:
+            errs.append(f"Celery executable not found: {cfg.CELERY_EXE}")
+        if _DAPHNE_BASENAME not in bin_names:
+            errs.append(f"Daphne executable not found: {cfg.DAPHNE_EXE}")
+
+    if "package.json" not in _dir_names(cfg.FRONTEND_DIR):
+        if os.path.isdir(cfg.FRONTEND_DIR):
+            errs.append(f"package.json not found in FRONTEND_DIR: {cfg.FRONTEND_DIR}")
+        else:
+            errs.append(f"FRONTEND_DIR not found: {cfg.FRONTEND_DIR}")
 
-    @staticmethod
-    def _normalized_rel(p: str) -> str:
-        if not p:
-            return "/"
-        return p if p.startswith("/") else "/" + p
+    npm_problem = _probe_exec(cfg.NPM_EXE)
+    if npm_problem:
+        errs.append(f"NPM_EXE {npm_problem}: {cfg.NPM_EXE}")
+    return errs
 
 
 class ConfigManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.data = None
+        self._stored = {}  # key -> encoded value as last read from / written to the DB
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_db()
 
+    def _connect(self):
+        """Open a connection to the config database with WAL and relaxed fsync."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-8192;
+            PRAGMA busy_timeout=3000;
+        """)
+        return conn
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self):
         """Initialize the database and create the config table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS config (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS config (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            # Storage format version, see _upgrade_db
+            self._user_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _write_rows(self, rows):
+        """Upsert (key, value) rows in a single transaction."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", rows
             )
-        """)
-        conn.commit()
-        conn.close()
 
-    def _migrate_json_to_db(self):
+    def _set_user_version(self, version: int):
+        with self._lock:
+            self._conn.execute(f"PRAGMA user_version = {int(version)}")
+        self._user_version = version
+
+    def _upgrade_db(self):
+        """Apply one-time upgrades to older databases, in order."""
+        # 1: legacy JSON config imported
+        imported = self._user_version >= 1 or self._migrate_json_to_db()
+        if imported and self._user_version < 1:
+            self._set_user_version(1)
+        # 2: string values stored unencoded. Runs even when the import failed
+        # (it is retried on next load), since unwrapping is idempotent.
+        if self._user_version < 2:
+            self._unwrap_string_rows()
+            if imported:
+                self._set_user_version(2)
+
+    def _unwrap_string_rows(self):
+        """Rewrite JSON-encoded string values written by older versions as plain TEXT."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM config").fetchall()
+        unwrapped = []
+        for k, v in rows:
+            if k not in _STR_KEYS:
+                continue
+            try:
+                decoded = _json_loads(v)
+            except ValueError:
+                continue
+            if isinstance(decoded, str):
+                unwrapped.append((k, decoded))
+        if unwrapped:
+            self._write_rows(unwrapped)
+
+    def _migrate_json_to_db(self) -> bool:
         """One-time migration from old JSON config to database."""
         old_json_path = os.path.join(os.path.dirname(self.db_path), "launchpad.config.json")
         if os.path.exists(old_json_path):
@@ -254,19 +431,13 @@ class ConfigManager:
                     old_data = json.load(f) or {}
                 if old_data:
                     # Save to database
-                    conn = sqlite3.connect(self.db_path)
-                    cursor = conn.cursor()
-                    for k, v in old_data.items():
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
-                            (k, json.dumps(v))
-                        )
-                    conn.commit()
-                    conn.close()
+                    rows = [(k, _json_dumps(v)) for k, v in old_data.items()]
+                    self._write_rows(rows)
                     # Rename old file as backup
                     os.rename(old_json_path, old_json_path + ".backup")
             except Exception:
-                pass
+                return False
+        return True
 
     def _migrate(self, data: dict) -> dict:
         """Migrate old config keys to the current schema and drop unknowns."""
@@ -299,54 +470,76 @@ class ConfigManager:
         if migrated.get("MIGRATION_POLICY") not in ("manual", "always"):
             migrated["MIGRATION_POLICY"] = DEFAULTS["MIGRATION_POLICY"]
 
+        # Ensure LOG_SINK is valid
+        if migrated.get("LOG_SINK") not in ("ui", "file", "null"):
+            migrated["LOG_SINK"] = DEFAULTS["LOG_SINK"]
+
         return migrated
 
+    @staticmethod
+    def _encode(key, value):
+        return value if key in _STR_KEYS else _json_dumps(value)
+
+    @staticmethod
+    def _decode_rows(rows) -> dict:
+        """Decode stored config rows into a dict."""
+        try:
+            return {k: v if k in _STR_KEYS else _json_loads(v) for k, v in rows}
+        except ValueError:
+            # Hand-edited DB with a non-JSON value: keep undecodable values as raw strings
+            raw = {}
+            for k, v in rows:
+                try:
+                    raw[k] = v if k in _STR_KEYS else _json_loads(v)
+                except ValueError:
+                    raw[k] = v
+            return raw
+
+    def read_rows(self) -> list:
+        """All stored (key, value) rows, sorted by key, read over the shared connection."""
+        with self._lock:
+            return self._conn.execute("SELECT key, value FROM config ORDER BY key").fetchall()
+
     def load(self) -> Paths:
         """Load configuration from database."""
-        self._migrate_json_to_db()  # Check for old JSON config
+        if self._user_version < 2:
+            self._upgrade_db()  # Old JSON config, older value encoding
         
         raw = {}
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT key, value FROM config")
-            for key, value in cursor.fetchall():
-                try:
-                    raw[key] = json.loads(value)
-                except Exception:
-                    raw[key] = value
-            conn.close()
+            with self._lock:
+                rows = self._conn.execute("SELECT key, value FROM config").fetchall()
+            self._stored = dict(rows)
+            raw = self._decode_rows(rows)
         except Exception as e:
             print(f"Error loading config from database: {e}")
         
         data = self._migrate(raw)
         self.data = data
         
-        # If database was empty or missing keys, save the migrated defaults
-        if not raw or len(raw) < len(DEFAULTS):
-            paths = Paths(**data)
+        # If database was empty or missing keys, persist just the missing ones
+        missing = [(k, self._encode(k, data[k])) for k in DEFAULTS if k not in raw]
+        if missing:
             try:
-                self.save(paths)
+                self._write_rows(missing)
+                self._stored.update(missing)
             except Exception as e:
                 print(f"Error saving initial config: {e}")
-            return paths
         
         return Paths(**data)
 
     def save(self, p: Paths):
         """Save configuration to database."""
-        serializable = {k: getattr(p, k) for k in DEFAULTS.keys()}
+        values = _PATHS_GETTER(p)
+        serializable = dict(zip(_PATHS_KEYS, values))
+        # Only write rows whose stored value actually changed
+        rows = zip(_PATHS_KEYS, map(self._encode, _PATHS_KEYS, values))
+        rows = [(k, v) for k, v in rows if self._stored.get(k) != v]
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            for k, v in serializable.items():
-                cursor.execute(
-                    "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
-                    (k, json.dumps(v))
-                )
-            conn.commit()
-            conn.close()
+            if rows:
+                self._write_rows(rows)
+                self._stored.update(rows)
             self.data = serializable
             print(f"Configuration saved to database: {self.db_path}")
         except Exception as e:
@@ -364,36 +557,146 @@ class ProcessStatus(Enum):
     FAILED = "failed"
 
 class Proc:
-    def __init__(self, name, args, cwd, env=None, auto_restart=False):
+    def __init__(self, name, args, cwd, env=None, auto_restart=False, on_exit=None):
         self.name = name
         self.args = args
         self.cwd = cwd
-        self.env = env or os.environ.copy()
+        self.env = env  # None inherits LaunchPad's own environment without copying it
+        self.on_exit = on_exit  # one-shot commands: called with the exit code instead of crash handling
         self.p = None
         self.status = ProcessStatus.STOPPED
         self.auto_restart = auto_restart
         self.start_time = None
         self.restart_count = 0
         self.last_error = None
+        self._psutil_proc = None  # psutil.Process handle, created once at spawn
+        self._output_done = threading.Event()  # set once its output pipe hits EOF
+        self._last_reported_status = None  # last status passed to status_callback
     
     def get_resource_usage(self):
         """Get CPU and memory usage for this process."""
-        if not HAS_PSUTIL or not self.p or self.p.poll() is not None:
+        if not self._psutil_proc or self.p.poll() is not None:
             return None
         try:
-            proc = psutil.Process(self.p.pid)
-            return {
-                'cpu': proc.cpu_percent(interval=0.1),
-                'memory': proc.memory_info().rss / 1024 / 1024  # MB
-            }
+            proc = self._psutil_proc
+            with proc.oneshot():  # one round of /proc (or OS API) reads for both values
+                return {
+                    'cpu': proc.cpu_percent(interval=None),  # delta since the previous call
+                    'memory': proc.memory_info().rss / 1024 / 1024  # MB
+                }
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return None
 
 
+class ExitWatcher:
+    """Block until watched child processes exit, without polling.
+
+    Uses pidfd + epoll on Linux (>= 5.3) and kqueue on macOS. Where neither is
+    available (Windows, old kernels) ``supported`` is False and callers poll instead.
+    """
+    def __init__(self):
+        self._epoll = None
+        self._kqueue = None
+        self._pending = {}  # pidfd (epoll) or pid (kqueue) -> token
+        if hasattr(os, "pidfd_open") and hasattr(select, "epoll"):
+            try:
+                os.close(os.pidfd_open(os.getpid()))  # probe kernel support
+                self._epoll = select.epoll()
+            except OSError:
+                pass
+        elif hasattr(select, "kqueue"):
+            self._kqueue = select.kqueue()
+
+    @property
+    def supported(self):
+        return self._epoll is not None or self._kqueue is not None
+
+    def watch(self, pid, token) -> bool:
+        """Report token from wait() once pid exits. False if pid is already gone."""
+        try:
+            if self._epoll is not None:
+                pidfd = os.pidfd_open(pid)
+                self._pending[pidfd] = token
+                self._epoll.register(pidfd, select.EPOLLIN)
+            else:
+                self._pending[pid] = token
+                ev = select.kevent(pid, filter=select.KQ_FILTER_PROC,
+                                   flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                                   fflags=select.KQ_NOTE_EXIT)
+                self._kqueue.control([ev], 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def wait(self):
+        """Block until at least one watched process exits; return their tokens."""
+        if self._epoll is not None:
+            tokens = []
+            for pidfd, _ in self._epoll.poll():
+                self._epoll.unregister(pidfd)
+                os.close(pidfd)
+                tokens.append(self._pending.pop(pidfd))
+            return tokens
+        events = self._kqueue.control(None, 16)
+        return [self._pending.pop(ev.ident) for ev in events if ev.ident in self._pending]
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve(host, port):
+    """(family, sockaddr) candidates for host:port; managed hosts don't change at runtime."""
+    return tuple(
+        (family, sockaddr)
+        # AI_ADDRCONFIG: skip ::1 for "localhost" on hosts without IPv6
+        for family, _, _, _, sockaddr in socket.getaddrinfo(
+            host, port, 0, socket.SOCK_STREAM, 0, socket.AI_ADDRCONFIG)
+    )
+
+
+def _probe_ports(ports, host="127.0.0.1", timeout=0.5):
+    """Return {port: True (in use) / False (free) / None (unknown)} for every port.
+
+    All connects are started non-blocking and awaited together, so the whole
+    batch costs at most one ``timeout`` instead of one per port.
+    """
+    result = {}
+    with selectors.DefaultSelector() as sel:
+        for port in ports:
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError:
+                result[port] = None
+                continue
+            sock.setblocking(False)
+            err = sock.connect_ex((host, port))
+            if err == 0 or err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                sel.register(sock, selectors.EVENT_WRITE, data=port)
+            else:
+                result[port] = False  # refused straight away
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                sock = key.fileobj
+                result[key.data] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                sel.unregister(sock)
+                sock.close()
+
+        for key in list(sel.get_map().values()):
+            result[key.data] = None  # no answer within the budget
+            key.fileobj.close()
+    return result
+
+
 class StackController:
     def __init__(self, ui_log, cfg: Paths, status_callback=None, notify_callback=None):
         self.ui_log = ui_log
         self.cfg = cfg
+        # Copy-on-write: writers swap in a new dict under self.lock, readers just
+        # grab self.procs once and iterate it without locking
         self.procs = {}
         self.lock = threading.Lock()
         self._browser_opened = False
@@ -401,35 +704,86 @@ class StackController:
         self.notify_callback = notify_callback  # Callback for notifications
         self._monitoring_thread = None
         self._stop_monitoring = False
+        self._exit_watcher = ExitWatcher()
+        self._lsof_path = None if IS_LINUX else shutil.which("lsof")
+        self._listen_cache = None  # (monotonic timestamp, port index), see _listening_index
+        self._ts_cache = (0, "")  # (epoch second, "HH:MM:SS") for log()
+        # Set once a start attempt settles: the service accepts connections, fails
+        # to spawn, exits or is stopped. Cleared when the next start begins, so
+        # waiters must check the process status after waking.
+        self._ready = {"daphne": threading.Event()}
         self._start_monitoring()
+        # One thread drains every child's output; Windows can't select() on pipes,
+        # so there each child keeps its own reader thread (see _spawn)
+        self._log_sel = None
+        if not IS_WINDOWS:
+            self._log_sel = selectors.DefaultSelector()
+            threading.Thread(target=self._drain_logs, daemon=True).start()
 
     def _start_monitoring(self):
         """Start background thread to monitor process status."""
-        def monitor():
-            while not self._stop_monitoring:
-                time.sleep(2)
-                with self.lock:
-                    for key, proc in list(self.procs.items()):
+        if self._exit_watcher.supported:
+            def monitor():
+                # Woken by the kernel exactly when a watched child exits
+                while not self._stop_monitoring:
+                    for key, proc in self._exit_watcher.wait():
+                        self._handle_exit(key, proc)
+        else:
+            def monitor():
+                while not self._stop_monitoring:
+                    time.sleep(2)
+                    for key, proc in self.procs.items():
                         if proc.p and proc.p.poll() is not None and proc.status == ProcessStatus.RUNNING:
-                            # Process died
-                            proc.status = ProcessStatus.FAILED
-                            proc.last_error = f"Exited with code {proc.p.returncode}"
-                            self.log(f"⚠️ {proc.name} crashed!")
-                            if self.notify_callback:
-                                self.notify_callback(f"{proc.name} stopped unexpectedly", "error")
-                            
-                            # Auto-restart if enabled
-                            if proc.auto_restart and proc.restart_count < 3:
-                                proc.restart_count += 1
-                                self.log(f"🔄 Auto-restarting {proc.name} (attempt {proc.restart_count}/3)...")
-                                threading.Timer(2.0, lambda: self._restart_proc(key)).start()
+                            self._handle_exit(key, proc)
                         
-                        # Update status callback
-                        if self.status_callback:
-                            self.status_callback(key, proc.status)
+                        # Update status callback (no-op unless the status changed)
+                        self._report_status(key, proc)
         
         self._monitoring_thread = threading.Thread(target=monitor, daemon=True)
         self._monitoring_thread.start()
+
+    def _report_status(self, key, proc):
+        """Pass proc's status to status_callback, but only when it changed since the last report."""
+        status = proc.status
+        if status is proc._last_reported_status:
+            return
+        proc._last_reported_status = status
+        if self.status_callback:
+            self.status_callback(key, status)
+
+    def _handle_exit(self, key, proc):
+        """Update state after a managed child exits; report crashes and auto-restart."""
+        rc = proc.p.wait()  # already exited, this just reaps it
+        # Let the last output lines through first (grandchildren may hold the pipe open)
+        proc._output_done.wait(timeout=1.0)
+        self.ui_log(f"[{proc.name}] exited with code {rc}", proc.name)
+        with self.lock:
+            if self.procs.get(key) is not proc or proc.status != ProcessStatus.RUNNING:
+                return  # stopped on purpose, or already replaced by a newer process
+            if rc == 0 and not proc.auto_restart:
+                # One-shot commands (migrate, docker run -d) finishing normally
+                proc.status = ProcessStatus.STOPPED
+            else:
+                proc.status = ProcessStatus.FAILED
+                proc.last_error = f"Exited with code {rc}"
+        if key in self._ready:
+            self._ready[key].set()  # wake start_all, it sees the process is gone
+        
+        if proc.on_exit is not None:
+            proc.on_exit(rc)  # reports its own success or failure
+        elif proc.status == ProcessStatus.FAILED:
+            # Process died
+            self.log(f"⚠️ {proc.name} crashed!")
+            if self.notify_callback:
+                self.notify_callback(f"{proc.name} stopped unexpectedly", "error")
+            
+            # Auto-restart if enabled
+            if proc.auto_restart and proc.restart_count < 3:
+                proc.restart_count += 1
+                self.log(f"🔄 Auto-restarting {proc.name} (attempt {proc.restart_count}/3)...")
+                threading.Timer(2.0, self._restart_proc, args=(key,)).start()
+        
+        self._report_status(key, proc)
     
     def _kill_port_silently(self, port: int):
         """Silently kill any process using the specified port without prompting."""
@@ -437,15 +791,20 @@ class StackController:
         if not pids:
             return False
         
+        return self._kill_pids(pids, "Cleaned up PID {pid} ({name}) from port {port}", port)
+
+    def _kill_pids(self, pids, msg, port):
+        """Terminate each (pid, name, cmd), force-killing stragglers; True if any were stopped."""
         killed_any = False
         for pid, name, cmd in pids:
             try:
                 if HAS_PSUTIL:
-                    psutil.Process(pid).terminate()
+                    p = psutil.Process(pid)
+                    p.terminate()
                     try:
-                        psutil.Process(pid).wait(timeout=3)
+                        p.wait(timeout=3)
                     except Exception:
-                        psutil.Process(pid).kill()
+                        p.kill()
                 else:
                     os.kill(pid, 15)  # SIGTERM
                     time.sleep(1)
@@ -456,17 +815,16 @@ class StackController:
                     except Exception:
                         pass
                 killed_any = True
-                self.log(f"Cleaned up PID {pid} ({name}) from port {port}")
+                self.log(msg.format(pid=pid, name=name, port=port))
             except Exception as e:
                 self.log(f"Failed to terminate PID {pid}: {e}")
+        self._listen_cache = None  # listeners changed
         return killed_any
     
     def _restart_proc(self, key):
         """Restart a failed process."""
-        with self.lock:
-            proc = self.procs.get(key)
-            if not proc:
-                return
+        if key not in self.procs:
+            return
         
         # For daphne, clean up the port first
         if key == "daphne":
@@ -486,43 +844,124 @@ class StackController:
     
     def _find_pids_on_port(self, port: int):
         """Return a list of (pid, name, cmdline) listening on the given TCP port on localhost."""
-        results = []
+        return self._listening_index().get(port, [])
+
+    def _listening_index(self, ttl=1.0):
+        """Map port -> [(pid, name, cmdline), ...] for every TCP listener.
+
+        Built from a single scan and reused for ``ttl`` seconds, so checking several
+        ports in a row (Daphne, frontend) costs one scan instead of one per port.
+        """
+        cached = self._listen_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
         try:
-            if HAS_PSUTIL:
-                for conn in psutil.net_connections(kind='inet'):
-                    if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
-                        pid = conn.pid
-                        if pid is None:
-                            continue
-                        try:
-                            p = psutil.Process(pid)
-                            name = p.name()
-                            cmd = ' '.join(p.cmdline())[:300]
-                        except Exception:
-                            name, cmd = 'unknown', ''
-                        results.append((pid, name, cmd))
+            if IS_LINUX:
+                # Cheaper than psutil.net_connections, which walks every process's fds
+                listeners = self._proc_listeners()
+            elif HAS_PSUTIL:
+                listeners = self._psutil_listeners()
+            elif self._lsof_path:
+                listeners = self._lsof_listeners(self._lsof_path)
             else:
-                # Fallback: try lsof if available
+                listeners = []
+        except Exception:
+            listeners = []
+        index = {}
+        for port, pid, name, cmd in listeners:
+            entries = index.setdefault(port, [])
+            # de-dup (a process often listens on both IPv4 and IPv6)
+            if all(pid != seen for seen, _, _ in entries):
+                entries.append((pid, name, cmd))
+        self._listen_cache = (now, index)
+        return index
+
+    @staticmethod
+    def _proc_listeners():
+        """Linux only: (port, pid, name, cmdline) for every TCP listener, read straight from /proc."""
+        sockets = {}
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                with open(table) as f:
+                    next(f, None)  # header
+                    for line in f:
+                        fields = line.split()
+                        # fields: sl local_address rem_address st ... inode (10th)
+                        if fields[3] == "0A":
+                            port = int(fields[1].rsplit(":", 1)[1], 16)
+                            sockets[f"socket:[{fields[9]}]"] = port
+            except OSError:
+                continue
+        if not sockets:
+            return []
+
+        results = []
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            ports = set()
+            try:
+                with os.scandir(f"/proc/{entry.name}/fd") as fds:
+                    for fd_entry in fds:
+                        try:
+                            port = sockets.get(os.readlink(fd_entry.path))
+                        except OSError:
+                            continue  # fd closed while scanning
+                        if port is not None:
+                            ports.add(port)
+            except OSError:
+                continue  # not ours to inspect, or exited meanwhile
+            if not ports:
+                continue
+            try:
+                with open(f"/proc/{entry.name}/comm") as f:
+                    name = f.read().strip()
+                with open(f"/proc/{entry.name}/cmdline", errors="replace") as f:
+                    cmd = f.read().replace("\0", " ").strip()[:300]
+            except OSError:
+                name, cmd = 'unknown', ''
+            results.extend((port, int(entry.name), name, cmd) for port in ports)
+        return results
+
+    @staticmethod
+    def _psutil_listeners():
+        """(port, pid, name, cmdline) for every TCP listener, from one psutil.net_connections pass."""
+        results = []
+        names = {}
+        for conn in psutil.net_connections(kind='inet'):
+            if not conn.laddr or conn.status != psutil.CONN_LISTEN or conn.pid is None:
+                continue
+            pid = conn.pid
+            if pid not in names:
                 try:
-                    out = subprocess.check_output(["bash", "-lc", f"command -v lsof >/dev/null 2>&1 && lsof -nP -iTCP:{port} -sTCP:LISTEN || true"], text=True)
-                    for line in out.splitlines()[1:]:
-                        parts = [p for p in line.split() if p]
-                        if len(parts) >= 2 and parts[1].isdigit():
-                            pid = int(parts[1])
-                            name = parts[0]
-                            results.append((pid, name, ''))
+                    p = psutil.Process(pid)
+                    with p.oneshot():  # name and cmdline from one set of OS reads
+                        names[pid] = (p.name(), ' '.join(p.cmdline())[:300])
                 except Exception:
-                    pass
+                    names[pid] = ('unknown', '')
+            results.append((conn.laddr.port, pid, *names[pid]))
+        return results
+
+    @staticmethod
+    def _lsof_listeners(lsof_path):
+        """Fallback: (port, pid, name, '') for every TCP listener, parsed from one lsof run."""
+        results = []
+        try:
+            out = subprocess.run(
+                [lsof_path, "-nP", "-iTCP", "-sTCP:LISTEN"],
+                capture_output=True, text=True, timeout=2,
+            ).stdout
+            for line in out.splitlines()[1:]:
+                parts = line.split()
+                # NAME column looks like "*:8000 (LISTEN)" or "127.0.0.1:5173 (LISTEN)"
+                if len(parts) >= 3 and parts[1].isdigit() and parts[-1] == "(LISTEN)":
+                    port = parts[-2].rsplit(":", 1)[-1]
+                    if port.isdigit():
+                        results.append((int(port), int(parts[1]), parts[0], ''))
         except Exception:
             pass
-        # de-dup
-        seen = set()
-        uniq = []
-        for pid, name, cmd in results:
-            if pid not in seen:
-                uniq.append((pid, name, cmd))
-                seen.add(pid)
-        return uniq
+        return results
 
     def _prompt_kill_pids(self, port: int, pids: list, service_name: str):
         """Show a dialog listing the conflicting processes and ask user to kill them."""
@@ -549,158 +988,304 @@ class StackController:
             answer = False
         if not answer:
             return False
-        killed_any = False
-        for pid, name, cmd in pids:
-            try:
-                if HAS_PSUTIL:
-                    psutil.Process(pid).terminate()
-                    try:
-                        psutil.Process(pid).wait(timeout=3)
-                    except Exception:
-                        psutil.Process(pid).kill()
-                else:
-                    os.kill(pid, 15)
-                    time.sleep(1)
-                    # if still alive, force kill
-                    try:
-                        os.kill(pid, 0)
-                        os.kill(pid, 9)
-                    except Exception:
-                        pass
-                killed_any = True
-                self.log(f"Terminated PID {pid} ({name}) holding port {port}")
-            except Exception as e:
-                self.log(f"Failed to terminate PID {pid}: {e}")
-        return killed_any
+        return self._kill_pids(pids, "Terminated PID {pid} ({name}) holding port {port}", port)
+
+    def _port_state(self, port):
+        """(in_use, [(pid, name, cmdline), ...]) for a local TCP port; listeners are only looked up if in use."""
+        if not self._tcp_open("127.0.0.1", port, timeout=0.2):
+            return False, []
+        return True, self._find_pids_on_port(port)
 
     def check_port_conflict(self, port, service_name):
-        """Check if a port is already in use, optionally offer to kill the conflicting process."""
-        if self._tcp_open("127.0.0.1", port, timeout=0.2):
-            msg = f"⚠️ Port {port} is already in use! {service_name} may fail to start."
-            self.log(msg)
-            if self.notify_callback:
-                self.notify_callback(msg, "warning")
-            # Try to identify process and prompt user to kill
-            pids = self._find_pids_on_port(port)
-            if pids:
-                self._prompt_kill_pids(port, pids, service_name)
-                # Re-check
-                if self._tcp_open("127.0.0.1", port, timeout=0.2):
-                    return True
-                else:
-                    self.log(f"Port {port} has been freed. Continuing…")
-                    return False
+        """Check if a port is already in use, optionally offer to kill the conflicting process.
+
+        Returns True if the port is still taken afterwards.
+        """
+        in_use, pids = self._port_state(port)
+        if not in_use:
+            return False
+        msg = f"⚠️ Port {port} is already in use! {service_name} may fail to start."
+        self.log(msg)
+        if self.notify_callback:
+            self.notify_callback(msg, "warning")
+        # Try to identify process and prompt user to kill
+        if not pids or not self._prompt_kill_pids(port, pids, service_name):
+            return True
+        # Re-check: done as soon as the killed process lets go of the port
+        if not self._wait_port_closed("127.0.0.1", port, 2.0):
             return True
+        self.log(f"Port {port} has been freed. Continuing…")
         return False
 
     # ---------- Utility ----------
+    def snapshot_usage(self):
+        """Return {key: usage dict or None} for every managed process."""
+        return {key: proc.get_resource_usage() for key, proc in self.procs.items()}
+
     def log(self, line, tag="INFO"):
-        ts = time.strftime("%H:%M:%S")
-        self.ui_log(f"[{ts}] {line}", tag)
+        now = int(time.time())
+        cache = self._ts_cache
+        if cache[0] != now:
+            # Format at most once per second, however many lines are logged in it
+            cache = self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        self.ui_log(f"[{cache[1]}] {line}", tag)
 
     def _spawn(self, key, proc: Proc):
-        with self.lock:
-            if key in self.procs and self.procs[key].p and self.procs[key].p.poll() is None:
-                self.log(f"{proc.name} already running.")
-                return
+        current = self.procs.get(key)
+        if current and current.p and current.p.poll() is None:
+            self.log(f"{proc.name} already running.")
+            return
         
         proc.status = ProcessStatus.STARTING
-        if self.status_callback:
-            self.status_callback(key, proc.status)
+        self._report_status(key, proc)
         
         self.log(f"Starting {proc.name}…")
+        stdout = subprocess.PIPE
+        if self.cfg.LOG_SINK == "null":
+            stdout = subprocess.DEVNULL
+        elif self.cfg.LOG_SINK == "file":
+            try:
+                stdout = self._open_log_file(key)
+                self.log(f"{proc.name} output → {stdout.name}")
+            except OSError as e:
+                self.log(f"Can't open log file for {proc.name} ({e}); showing its output here instead")
         try:
             p = subprocess.Popen(
                 proc.args,
                 cwd=proc.cwd,
                 env=proc.env,
-                stdout=subprocess.PIPE,
+                stdout=stdout,
                 stderr=subprocess.STDOUT,
-                text=True,
+                # Must stay on: children must not inherit sibling output pipes (their EOF
+                # would never arrive), pidfds or the config DB. CPython closes only the
+                # fds actually open (/proc/self/fd, close_range), not every fd up to NOFILE.
+                close_fds=True,
             )
             proc.start_time = datetime.now()
+            if HAS_PSUTIL:
+                try:
+                    proc._psutil_proc = psutil.Process(p.pid)
+                    proc._psutil_proc.cpu_percent(interval=None)  # baseline for later non-blocking reads
+                except psutil.NoSuchProcess:
+                    pass
         except FileNotFoundError as e:
             self.log(f"ERROR: {proc.name} not found: {e}")
             proc.status = ProcessStatus.FAILED
             proc.last_error = str(e)
-            if self.status_callback:
-                self.status_callback(key, proc.status)
+            self._report_status(key, proc)
             if self.notify_callback:
                 self.notify_callback(f"{proc.name} failed to start", "error")
             return
+        finally:
+            if not isinstance(stdout, int):
+                stdout.close()  # the child holds its own handle
+
+        if p.stdout is None:
+            # file/null sink: the child writes straight to it, nothing for us to read
+            proc._output_done.set()
+        elif self._log_sel:
+            os.set_blocking(p.stdout.fileno(), False)
+            self._log_sel.register(p.stdout, selectors.EVENT_READ, data=(proc, bytearray()))
+        else:
+            def pump():
+                buf = bytearray()
+                while True:
+                    data = p.stdout.read1(65536)
+                    self._forward_output(proc, buf, data)
+                    if not data:
+                        break
 
-        def pump():
-            for line in iter(p.stdout.readline, ''):
-                if not line:
-                    break
-                self.ui_log(f"[{proc.name}] {line.rstrip()}", proc.name)
-            rc = p.wait()
-            self.ui_log(f"[{proc.name}] exited with code {rc}", proc.name)
-
-        threading.Thread(target=pump, daemon=True).start()
+            threading.Thread(target=pump, daemon=True).start()
         
         with self.lock:
             proc.p = p
             proc.status = ProcessStatus.RUNNING
-            self.procs[key] = proc
+            self.procs = {**self.procs, key: proc}
         
-        if self.status_callback:
-            self.status_callback(key, proc.status)
+        self._report_status(key, proc)
         if self.notify_callback:
             self.notify_callback(f"{proc.name} started successfully", "success")
+        
+        if self._exit_watcher.supported and not self._exit_watcher.watch(p.pid, (key, proc)):
+            self._handle_exit(key, proc)  # exited (and was reaped) before we could watch it
+
+    @staticmethod
+    def _open_log_file(key):
+        """Open LOG_DIR/<key>.log for appending, rolling it over to .log.1 once it gets large."""
+        os.makedirs(LOG_DIR, exist_ok=True)
+        path = os.path.join(LOG_DIR, f"{key}.log")
+        try:
+            if os.path.getsize(path) > LOG_ROTATE_BYTES:
+                os.replace(path, path + ".1")
+        except OSError:
+            pass  # no log yet
+        return open(path, "ab", buffering=0)
+
+    def _drain_logs(self):
+        """Reader thread: forward complete lines from every registered child pipe to the UI."""
+        while True:
+            for sel_key, _ in self._log_sel.select():
+                proc, buf = sel_key.data
+                try:
+                    data = os.read(sel_key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    data = b""
+                if not data:
+                    # EOF: child closed its output
+                    self._log_sel.unregister(sel_key.fileobj)
+                    sel_key.fileobj.close()
+                self._forward_output(proc, buf, data)
+
+    def _forward_output(self, proc, buf, data):
+        """Append raw child output to buf and log every complete line; data=b"" flushes at EOF."""
+        if data:
+            buf += data
+            end = buf.rfind(b"\n")
+            if end < 0:
+                return  # no complete line yet
+            # One decode per chunk, not per line
+            chunk = buf[:end].decode("utf-8", "replace")
+            del buf[:end + 1]
+        else:
+            chunk = buf.decode("utf-8", "replace") if buf else None
+            buf.clear()
+        if chunk is not None:
+            name = proc.name
+            for line in chunk.split("\n"):
+                self.ui_log(f"[{name}] {line.rstrip()}", name)
+        if not data:
+            proc._output_done.set()
 
     def _terminate(self, key):
-        with self.lock:
+        self._stop_procs([key])
+
+    def _stop_procs(self, keys, grace=4.0):
+        """Stop the given managed processes together.
+
+        Every live process gets SIGTERM up front, then all of them share one
+        ``grace`` deadline before the survivors are killed.
+        """
+        stopping = []
+        for key in keys:
+            if key in self._ready:
+                self._ready[key].set()  # don't leave start_all waiting on it
             proc = self.procs.get(key)
-        if not proc or not proc.p:
+            if not proc or not proc.p:
+                continue
+            running = proc.p.poll() is None
+            if running:
+                self.log(f"Stopping {proc.name}…")
+                with self.lock:
+                    # Mark first so the exit monitor doesn't report this as a crash
+                    proc.status = ProcessStatus.STOPPED
+                try:
+                    proc.p.terminate()
+                except Exception:
+                    pass
+            stopping.append((key, proc, running))
+        if not stopping:
             return
-        if proc.p.poll() is None:
-            self.log(f"Stopping {proc.name}…")
+
+        deadline = time.monotonic() + grace
+        for key, proc, running in stopping:
+            if not running:
+                continue
             try:
-                proc.p.terminate()
-            except Exception:
-                pass
-            for _ in range(20):
-                if proc.p.poll() is not None:
-                    break
-                time.sleep(0.2)
-            if proc.p.poll() is None:
+                proc.p.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
                 try:
                     proc.p.kill()
                 except Exception:
                     pass
             self.log(f"{proc.name} stopped.")
+
+        stopped = {key for key, _, _ in stopping}
         with self.lock:
-            proc.status = ProcessStatus.STOPPED
-            if self.status_callback:
-                self.status_callback(key, proc.status)
-            self.procs.pop(key, None)
+            for _, proc, _ in stopping:
+                proc.status = ProcessStatus.STOPPED
+            self.procs = {k: v for k, v in self.procs.items() if k not in stopped}
+        self._listen_cache = None  # their ports may be free now
+        for key, proc, _ in stopping:
+            self._report_status(key, proc)
 
     def _tcp_open(self, host, port, timeout=0.5):
         try:
-            with socket.create_connection((host, port), timeout=timeout):
-                return True
+            candidates = _resolve(host, port)
         except OSError:
             return False
+        # Like socket.create_connection, minus the getaddrinfo call on every probe
+        for family, addr in candidates:
+            try:
+                s = socket.socket(family, socket.SOCK_STREAM)
+            except OSError:
+                continue  # e.g. EAFNOSUPPORT for AF_INET6 with IPv6 disabled
+            with s:
+                s.settimeout(timeout)
+                try:
+                    s.connect(addr)
+                    return True
+                except OSError:
+                    continue
+        return False
 
-    def _http_ok(self, url, timeout=1.0):
-        try:
-            host_port = url.split("//", 1)[1].split("/", 1)[0]
-            host, port = host_port.split(":")
-            path = url.split(host_port, 1)[1] or "/"
-            conn = HTTPConnection(host, int(port), timeout=timeout)
-            conn.request("GET", path)
-            resp = conn.getresponse()
-            return 200 <= resp.status < 500
-        except Exception:
-            return False
+    def _wait_port(self, host, port, deadline_s):
+        """Block until host:port accepts TCP connections; False after deadline_s seconds."""
+        deadline = time.monotonic() + deadline_s
+        delay = 0.1
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # A listening port answers at once; only a refused connect waits and retries
+            if self._tcp_open(host, port, timeout=remaining):
+                return True
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(delay * 2, 1.0)
+
+    def _wait_port_closed(self, host, port, deadline_s):
+        """Block until host:port stops accepting connections; False if still open after deadline_s."""
+        deadline = time.monotonic() + deadline_s
+        while self._tcp_open(host, port, timeout=0.2):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _wait_ports_closed(self, ports, deadline_s):
+        """Wait for several local ports to close against one deadline; return those still open."""
+        deadline = time.monotonic() + deadline_s
+        still_open = list(ports)
+        while still_open:
+            # All remaining ports probed at once, so N ports cost one round per poll
+            states = _probe_ports(still_open, timeout=0.2)
+            still_open = [port for port in still_open if states[port]]
+            if not still_open or time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+        return still_open
+
+    def _http_ok(self, conn, path):
+        """HEAD path over conn (kept alive between probes); True for any non-5xx reply."""
+        conn.request("HEAD", path)
+        resp = conn.getresponse()
+        resp.read()
+        return 200 <= resp.status < 500
 
     # ---------- Preflight ----------
     def migrate_db(self):
+        """Start `manage.py migrate`; return its Proc (or the one already running), None if it failed to start."""
         self.log("Running Django migrations…")
-        args = [self.cfg.PYTHON_EXE, os.path.join(self.cfg.PROJECT_ROOT, "manage.py"), "migrate", "--noinput"]
+        args = (self.cfg.PYTHON_EXE, os.path.join(self.cfg.PROJECT_ROOT, "manage.py"), "migrate", "--noinput")
         proc = Proc("migrate", args, cwd=self.cfg.PROJECT_ROOT)
         self._spawn("migrate", proc)
+        if proc.p is None:
+            current = self.procs.get("migrate")
+            if current and current.p and current.p.poll() is None:
+                return current
+            return None
+        return proc
 
     # ---------- Redis ----------
     def ensure_redis(self):
@@ -728,21 +1313,19 @@ class StackController:
             return
 
         self.log("Redis not detected; attempting to launch Docker Redis…")
-        args = [
+        args = (
             self.cfg.DOCKER_EXE, "run", "--rm", "-d",
             "--name", self.cfg.REDIS_DOCKER_NAME,
             "-p", f"{self.cfg.REDIS_PORT}:6379",
             "--memory", self.cfg.DOCKER_MEMORY_LIMIT,
             "--cpus", str(self.cfg.DOCKER_CPU_LIMIT),
             "redis:7",
-        ]
+        )
         proc = Proc("redis(docker)", args, cwd=self.cfg.PROJECT_ROOT)
         self._spawn("redis_docker", proc)
-        for _ in range(40):
-            if self._tcp_open(self.cfg.REDIS_HOST, self.cfg.REDIS_PORT):
-                self.log("Redis is up.")
-                return
-            time.sleep(0.25)
+        if self._wait_port(self.cfg.REDIS_HOST, self.cfg.REDIS_PORT, 10):
+            self.log("Redis is up.")
+            return
         self.log("WARNING: Redis still not reachable. Check logs or start your service manually.")
     
     def _try_homebrew_redis(self):
@@ -769,11 +1352,9 @@ class StackController:
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     # Wait for Redis to be available
-                    for _ in range(20):
-                        if self._tcp_open(self.cfg.REDIS_HOST, self.cfg.REDIS_PORT):
-                            self.log("✅ Homebrew Redis started successfully")
-                            return True
-                        time.sleep(0.5)
+                    if self._wait_port(self.cfg.REDIS_HOST, self.cfg.REDIS_PORT, 10):
+                        self.log("✅ Homebrew Redis started successfully")
+                        return True
                     self.log("Homebrew Redis started but not yet reachable, continuing...")
                     return False
         except Exception as e:
@@ -782,26 +1363,32 @@ class StackController:
 
     # ---------- Backend ----------
     def start_daphne(self):
-        self.check_port_conflict(self.cfg.DAPHNE_PORT, "Daphne")
-        args = [
+        ready = self._ready["daphne"]
+        ready.clear()
+        # Another listener would answer the probe below in Daphne's place
+        port_taken = self.check_port_conflict(self.cfg.DAPHNE_PORT, "Daphne")
+        args = (
             self.cfg.DAPHNE_EXE,
             f"{self.cfg.DJANGO_ASGI_APP}",
             "--port", str(self.cfg.DAPHNE_PORT),
             "--bind", self.cfg.DAPHNE_HOST,
-        ]
-        env = os.environ.copy()
-        env["PYTHONUNBUFFERED"] = "1"
+        )
+        env = {**os.environ, "PYTHONUNBUFFERED": "1"}
         proc = Proc("daphne", args, cwd=self.cfg.PROJECT_ROOT, env=env, auto_restart=True)
         self._spawn("daphne", proc)
+        if proc.status == ProcessStatus.FAILED:
+            ready.set()  # didn't spawn: start_all needn't wait for it
+            return
+        if port_taken:
+            return  # the exit watcher sets `ready` once Daphne fails to bind
 
         def waiter():
-            for _ in range(120):
-                if self._tcp_open(self.cfg.DAPHNE_HOST, self.cfg.DAPHNE_PORT):
-                    self.log(f"Daphne reachable at http://{self.cfg.DAPHNE_HOST}:{self.cfg.DAPHNE_PORT}")
-                    if self.cfg.FETCH_OPENAPI and self.cfg.OPENAPI_URL:
-                        self.fetch_openapi()
-                    return
-                time.sleep(0.5)
+            if self._wait_port(self.cfg.DAPHNE_HOST, self.cfg.DAPHNE_PORT, 60):
+                ready.set()
+                self.log(f"Daphne reachable at http://{self.cfg.DAPHNE_HOST}:{self.cfg.DAPHNE_PORT}")
+                if self.cfg.FETCH_OPENAPI and self.cfg.OPENAPI_URL:
+                    self.fetch_openapi()
+                return
             self.log("ERROR: Daphne did not become reachable in time.")
 
         threading.Thread(target=waiter, daemon=True).start()
@@ -821,44 +1408,48 @@ class StackController:
 
     def start_celery_beat(self):
         try:
-            if os.path.exists(self.cfg.CELERY_BEAT_SCHEDULE_PATH):
-                os.remove(self.cfg.CELERY_BEAT_SCHEDULE_PATH)
+            os.remove(self.cfg.CELERY_BEAT_SCHEDULE_PATH)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.log(f"WARNING: could not remove old beat schedule: {e}")
-        args = [
+        args = (
             self.cfg.CELERY_EXE, "-A", "scanner_backend.celery:app",
             "beat", "-l", "info", "-s", self.cfg.CELERY_BEAT_SCHEDULE_PATH,
-        ]
+        )
         proc = Proc("celery-beat", args, cwd=self.cfg.PROJECT_ROOT, auto_restart=True)
         self._spawn("celery_beat", proc)
 
     def start_celery_worker(self):
         if self.cfg.CELERY_POOL in ("eventlet", "gevent"):
-            args = [
+            args = (
                 self.cfg.CELERY_EXE, "-A", "scanner_backend.celery:app", "worker",
                 "-Q", self.cfg.CELERY_QUEUE, "-l", "info",
                 "-P", self.cfg.CELERY_POOL, "-c", str(self.cfg.CELERY_CONCURRENCY),
                 "--without-gossip", "--without-mingle", "--without-heartbeat",
-            ]
+            )
         else:
-            args = [
+            args = (
                 self.cfg.CELERY_EXE, "-A", "scanner_backend.celery:app", "worker",
                 "-Q", self.cfg.CELERY_QUEUE, "-l", "info",
                 "-P", self.cfg.CELERY_POOL, "-c", str(self.cfg.CELERY_CONCURRENCY),
-            ]
+            )
         proc = Proc("celery-worker", args, cwd=self.cfg.PROJECT_ROOT, auto_restart=True)
         self._spawn("celery_worker", proc)
 
     # ---------- Frontend ----------
     def _get_nvm_environment(self):
-        """Get environment with NVM loaded for Node.js access."""
-        env = os.environ.copy()
+        """Get environment with NVM loaded for Node.js access.
+
+        Returns (env, npm_path); env is None when the inherited environment is fine as is.
+        """
+        env = None
         
         # Try to detect NVM installation
-        nvm_dir = env.get('NVM_DIR') or os.path.expanduser('~/.nvm')
+        nvm_dir = os.environ.get('NVM_DIR') or os.path.expanduser('~/.nvm')
         
         if not os.path.exists(nvm_dir):
-            return env  # NVM not found, return default environment
+            return env, None  # NVM not found, use the default environment
         
         # Try to get the current NVM version or use default
         try:
@@ -870,10 +1461,8 @@ class StackController:
                 node_bin_dir = os.path.dirname(node_path)
                 
                 # Update PATH to include the NVM node version
-                if 'PATH' in env:
-                    env['PATH'] = f"{node_bin_dir}:{env['PATH']}"
-                else:
-                    env['PATH'] = node_bin_dir
+                path = os.environ.get('PATH')
+                env = {**os.environ, 'PATH': f"{node_bin_dir}:{path}" if path else node_bin_dir}
                 
                 # Get npm path too
                 npm_cmd = f'bash -lc "source {nvm_dir}/nvm.sh && command -v npm"'
@@ -891,90 +1480,124 @@ class StackController:
     
     def start_frontend(self):
         # Check if frontend is already running (managed by us)
-        with self.lock:
-            if "frontend" in self.procs and self.procs["frontend"].p and self.procs["frontend"].p.poll() is None:
-                self.log("Frontend is already running (managed).")
-                return
+        current = self.procs.get("frontend")
+        if current and current.p and current.p.poll() is None:
+            self.log("Frontend is already running (managed).")
+            return
         
-        # Check if port is in use by another process
-        if self._tcp_open("127.0.0.1", self.cfg.FRONTEND_PORT, timeout=0.2):
-            self.log(f"⚠️ Frontend port {self.cfg.FRONTEND_PORT} is already in use by another process.")
-            if self.notify_callback:
-                self.notify_callback(f"Frontend port {self.cfg.FRONTEND_PORT} already in use", "warning")
-            # Try to identify and optionally kill the process
-            pids = self._find_pids_on_port(self.cfg.FRONTEND_PORT)
-            if pids:
-                if self._prompt_kill_pids(self.cfg.FRONTEND_PORT, pids, "Frontend"):
-                    time.sleep(1)  # Give it a moment to free the port
-                    if self._tcp_open("127.0.0.1", self.cfg.FRONTEND_PORT, timeout=0.2):
-                        self.log("Port still in use. Aborting frontend start.")
-                        return
-                else:
-                    self.log("Port conflict not resolved. Aborting frontend start.")
-                    return
-            else:
-                self.log("Could not identify process on port. Aborting frontend start.")
-                return
+        # Check if port is in use by another process (offers to kill it)
+        if self.check_port_conflict(self.cfg.FRONTEND_PORT, "Frontend"):
+            self.log("Port conflict not resolved. Aborting frontend start.")
+            return
         
         # Get NVM environment and npm path if available
         nvm_env, nvm_npm_path = self._get_nvm_environment()
         npm_exe = nvm_npm_path if nvm_npm_path else self.cfg.NPM_EXE
         
-        args = [
+        args = (
             npm_exe, "run", "dev", "--",
             "--port", str(self.cfg.FRONTEND_PORT),
             "--strictPort",
             "--host", self.cfg.FRONTEND_HOST,
-        ]
+        )
         proc = Proc("frontend", args, cwd=self.cfg.FRONTEND_DIR, env=nvm_env, auto_restart=True)
         self._spawn("frontend", proc)
 
         if self.cfg.AUTO_OPEN_BROWSER:
             def opener():
-                for _ in range(240):
-                    if self._http_ok(self.cfg.FRONTEND_URL, timeout=0.5):
-                        if not self._browser_opened:
-                            self._browser_opened = True
-                            self.log(f"Opening browser → {self.cfg.FRONTEND_URL}")
-                            webbrowser.open(self.cfg.FRONTEND_URL)
-                        return
-                    time.sleep(0.5)
+                url = self.cfg.FRONTEND_URL
+                u = urlsplit(url)
+                host = u.hostname
+                port = u.port or (443 if u.scheme == "https" else 80)
+                path = u.path or "/"
+                deadline = time.monotonic() + 120
+                
+                # Nothing to ask over HTTP until the dev server is listening
+                if self._wait_port(host, port, 120):
+                    conn = HTTPConnection(host, port, timeout=0.5)
+                    try:
+                        while time.monotonic() < deadline:
+                            try:
+                                ok = self._http_ok(conn, path)
+                            except Exception:
+                                conn.close()  # reconnects on the next request
+                                ok = False
+                            if ok:
+                                if not self._browser_opened:
+                                    self._browser_opened = True
+                                    self.log(f"Opening browser → {url}")
+                                    import webbrowser
+                                    webbrowser.open(url)
+                                return
+                            time.sleep(0.5)
+                    finally:
+                        conn.close()
                 self.log("WARNING: Frontend URL did not become reachable in time.")
             threading.Thread(target=opener, daemon=True).start()
 
+    def build_frontend(self):
+        """Start `npm run build` as a managed one-shot process, like migrate.
+
+        Output streams into the log and the exit is picked up by the exit watcher,
+        so no thread sits blocked waiting for the build.
+        """
+        def on_exit(rc):
+            if rc == 0:
+                self.log("✅ Frontend build completed successfully")
+            else:
+                self.log(f"❌ Frontend build failed: exited with code {rc}")
+
+        nvm_env, nvm_npm_path = self._get_nvm_environment()
+        npm_exe = nvm_npm_path if nvm_npm_path else self.cfg.NPM_EXE
+        proc = Proc("frontend build", (npm_exe, "run", "build"), cwd=self.cfg.FRONTEND_DIR,
+                    env=nvm_env, on_exit=on_exit)
+        self._spawn("build", proc)
+
     # ---------- Orchestration ----------
     def start_backend(self):
+        """Start Redis, migrations (per policy), Daphne and Celery; False if migrations failed."""
         self.ensure_redis()
         if self.cfg.MIGRATION_POLICY == "always":
-            self.migrate_db()
-            # give migrate some breathing room; it runs in its own proc anyway
-            time.sleep(1.0)
-        threading.Timer(1.0, self.start_daphne).start()
-        threading.Timer(1.5, self.start_celery_beat).start()
-        threading.Timer(2.0, self.start_celery_worker).start()
+            # Daphne and Celery need the schema in place: wait for migrate to finish
+            mig = self.migrate_db()
+            rc = mig.p.wait() if mig else None
+            if rc != 0:
+                reason = "could not be started" if rc is None else f"exited with code {rc}"
+                self.log(f"ERROR: Migrations {reason}; not starting the backend.")
+                return False
+        # Redis is already reachable here; Celery only needs Redis, so no waiting on Daphne
+        self.start_daphne()
+        self.start_celery_beat()
+        self.start_celery_worker()
+        return True
 
     def start_all(self):
-        self.start_backend()
-        threading.Timer(3.0, self.start_frontend).start()
+        if not self.start_backend():
+            return
+        # The dev server proxies to Daphne: start it once Daphne answers, not after a fixed delay
+        reachable = self._ready["daphne"].wait(60)
+        daphne = self.procs.get("daphne")
+        if not daphne or daphne.status != ProcessStatus.RUNNING:
+            self.log("Daphne is not running; not starting the frontend.")
+            return
+        if not reachable:
+            self.log("Daphne not reachable yet; starting frontend anyway.")
+        self.start_frontend()
 
     def stop_all(self):
         """Stop all managed processes without blocking the UI thread."""
         def worker():
-            order = ["frontend", "celery_worker", "celery_beat", "daphne", "redis_docker", "migrate"]
+            order = ["frontend", "build", "celery_worker", "celery_beat", "daphne", "redis_docker", "migrate"]
             self.log("Stopping all services…")
-            for key in order:
-                try:
-                    self._terminate(key)
-                    time.sleep(0.5)  # Brief delay between terminations
-                except Exception as e:
-                    self.log(f"Error stopping {key}: {e}")
+            try:
+                self._stop_procs(order)
+            except Exception as e:
+                self.log(f"Error stopping services: {e}")
             
             # Verify ports are freed
-            time.sleep(1)
-            if self._tcp_open("127.0.0.1", self.cfg.FRONTEND_PORT, timeout=0.2):
-                self.log(f"⚠️ Warning: Frontend port {self.cfg.FRONTEND_PORT} still in use after stop")
-            if self._tcp_open("127.0.0.1", self.cfg.DAPHNE_PORT, timeout=0.2):
-                self.log(f"⚠️ Warning: Daphne port {self.cfg.DAPHNE_PORT} still in use after stop")
+            names = {self.cfg.FRONTEND_PORT: "Frontend", self.cfg.DAPHNE_PORT: "Daphne"}
+            for port in self._wait_ports_closed(names, 1.0):
+                self.log(f"⚠️ Warning: {names[port]} port {port} still in use after stop")
             
             self.log("All services stopped.")
         threading.Thread(target=worker, daemon=True).start()
@@ -1090,6 +1713,14 @@ class ConfigDialog(tk.Toplevel):
         self.cb_mig.set(self.cfg.MIGRATION_POLICY)
         r += 1
 
+        # ----- Process output -----
+        ttk.Label(frm, text="Process Output:").grid(row=r, column=0, sticky="w", **pad)
+        self.cb_log_sink = ttk.Combobox(frm, values=["ui", "file", "null"], state="readonly", width=15)
+        self.cb_log_sink.grid(row=r, column=1, sticky="w", **pad)
+        self.cb_log_sink.set(self.cfg.LOG_SINK)
+        ttk.Label(frm, text="(file = logs folder next to the config DB)").grid(row=r, column=2, sticky="w")
+        r += 1
+
         # ----- OpenAPI -----
         self.var_fetch_openapi = tk.BooleanVar(value=self.cfg.FETCH_OPENAPI)
         ttk.Checkbutton(frm, text="Fetch OpenAPI on startup", variable=self.var_fetch_openapi).grid(
@@ -1210,6 +1841,7 @@ class ConfigDialog(tk.Toplevel):
         cconc = self._parse_int("Celery Concurrency", self.e_cconc.get().strip(), 1, errs)
 
         mig_policy = self.cb_mig.get().strip() or "manual"
+        log_sink = self.cb_log_sink.get().strip() or "ui"
         if mig_policy not in ("manual", "always"):
             errs.append("Migration Policy must be 'manual' or 'always'.")
 
@@ -1227,43 +1859,13 @@ class ConfigDialog(tk.Toplevel):
             docker_cpu = float(docker_cpu_str)
             if docker_cpu <= 0:
                 raise ValueError
-        except:
+        except ValueError:
             errs.append(f"Docker CPU limit must be a positive number (got {docker_cpu_str!r})")
             docker_cpu = 1.0
 
-        # Basic path checks
-        if not os.path.exists(proj):
-            errs.append(f"PROJECT_ROOT not found: {proj}")
-        if not os.path.exists(fe):
-            errs.append(f"FRONTEND_DIR not found: {fe}")
-        if not os.path.exists(npm):
-            errs.append(f"NPM_EXE not found: {npm}")
-
-        # Derived executables from backend venv
-        venv_dir = os.path.join(proj, "venv")
-        venv_bin = os.path.join(venv_dir, "Scripts" if IS_WINDOWS else "bin")
-        py = os.path.join(venv_bin, "python.exe" if IS_WINDOWS else "python")
-        cel = os.path.join(venv_bin, "celery.exe" if IS_WINDOWS else "celery")
-        dph = os.path.join(venv_bin, "daphne.exe" if IS_WINDOWS else "daphne")
-
-        if not os.path.exists(py):
-            errs.append(f"Python venv not found: {py} (expected under PROJECT_ROOT/venv)")
-        if not os.path.exists(cel):
-            errs.append(f"Celery executable not found: {cel}")
-        if not os.path.exists(dph):
-            errs.append(f"Daphne executable not found: {dph}")
-
-        pkg_json = os.path.join(fe, "package.json")
-        if not os.path.exists(pkg_json):
-            errs.append(f"package.json not found in FRONTEND_DIR: {fe}")
-
         if cpool == "solo" and cconc != 1:
             errs.append("With Celery pool 'solo', concurrency must be 1.")
 
-        if errs:
-            messagebox.showerror("Invalid Configuration", "Fix these issues:\n\n" + "\n".join(errs))
-            return
-
         new_cfg = Paths(
             PROJECT_ROOT=proj,
             FRONTEND_DIR=fe,
@@ -1284,15 +1886,73 @@ class ConfigDialog(tk.Toplevel):
             CELERY_POOL=cpool,
             CELERY_CONCURRENCY=cconc,
             MIGRATION_POLICY=mig_policy,
+            LOG_SINK=log_sink,
             DOCKER_MEMORY_LIMIT=docker_mem,
             DOCKER_CPU_LIMIT=docker_cpu,
         )
+        errs += _validate_paths(new_cfg)
+
+        if errs:
+            messagebox.showerror("Invalid Configuration", "Fix these issues:\n\n" + "\n".join(errs))
+            return
 
         self.on_save(new_cfg)
         self.destroy()
 
 
 # --------------- Main App UI ---------------
+_USAGE_COLORS = ("green", "orange", "red")  # below 50% / below 80% / above
+_IDLE_USAGE_LABEL = ("--", "gray")
+# One search per log line decides its colour: group 1 -> "error" tag, group 2 -> "warning"
+_LOG_CLASSIFIER = re.compile(r"(?i)\b(?:(error|exception|traceback|critical)|(warn|warning))\b")
+_LOG_LINE_TAGS = {None: (), 1: ("error",), 2: ("warning",)}
+
+@functools.lru_cache(maxsize=1024)
+def _usage_label(cpu, mem_mb):
+    """(text, color) for a resource label; takes pre-rounded values so repeats hit the cache."""
+    return f"CPU: {cpu:.1f}%  RAM: {mem_mb} MB", _USAGE_COLORS[(cpu >= 50) + (cpu >= 80)]
+
+
+@functools.lru_cache(maxsize=1)
+def _host_cpu_counts():
+    """(physical, logical) core counts; fixed for the life of the process, so read once."""
+    logical = psutil.cpu_count(logical=True)
+    return psutil.cpu_count(logical=False) or logical, logical
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_icon_image():
+    """Tray icon, drawn once; PIL is imported here so it stays off the startup path."""
+    from PIL import Image, ImageDraw  # type: ignore
+    img = Image.new('RGB', (64, 64), color='#2196F3')
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([10, 10, 54, 54], fill='white')
+    draw.text((20, 20), "SC", fill='#2196F3')
+    return img
+
+
+def _docker_sdk_matches_cli(docker_exe) -> bool:
+    """True if the docker SDK's from_env() reaches the daemon ``docker_exe`` would.
+
+    from_env() only knows DOCKER_HOST and the default socket: podman and friends,
+    or a CLI on a non-default ``docker context``, talk to somewhere else.
+    """
+    exe = os.path.realpath(shutil.which(docker_exe) or docker_exe)
+    if os.path.basename(exe).lower() not in ("docker", "docker.exe"):
+        return False
+    if os.environ.get("DOCKER_HOST"):
+        return True  # overrides the context for the CLI too
+    context = os.environ.get("DOCKER_CONTEXT")
+    if context is None:
+        config_dir = os.environ.get("DOCKER_CONFIG") or os.path.join(os.path.expanduser("~"), ".docker")
+        try:
+            with open(os.path.join(config_dir, "config.json"), "rb") as f:
+                context = _json_loads(f.read()).get("currentContext")
+        except (OSError, ValueError, AttributeError):
+            context = None
+    return context in (None, "", "default")
+
+
 class App(tk.Tk):
     def __init__(self, cfg: Paths, cfg_mgr: ConfigManager):
         super().__init__()
@@ -1302,6 +1962,12 @@ class App(tk.Tk):
         self.cfg_mgr = cfg_mgr
         self.status_indicators = {}
         self.resource_labels = {}
+        self._resource_wake = threading.Event()  # set on status changes, see _start_resource_monitoring
+        self._system_cpu = None  # system-wide CPU %, refreshed by the resource monitor
+        self._docker_info_cache = None  # (monotonic time, DOCKER_EXE, info dict or None)
+        self._docker_client = None  # docker SDK client, reused; False if the SDK can't be imported
+        self._notify_bus = None  # session-bus connection for notifications; False once it failed
+        self._notify_lock = threading.Lock()  # notifications arrive from controller threads
         self.log_tabs = {}
 
         # Top button bar
@@ -1399,16 +2065,24 @@ class App(tk.Tk):
             ("frontend", "Frontend"),
             ("redis(docker)", "Redis"),
             ("migrate", "Migrations"),
+            ("frontend build", "Build"),
             ("INFO", "System"),
         ]
         
+        # Tabs start as empty frames; the Text widget inside is only built once the
+        # tab is shown or gets its first line (see _ensure_tab)
+        self._tab_tags = {}  # frame widget path -> tag, so notebook.select() maps straight to a tab
+        self._log_frames = {}
         for tag, label in log_names:
-            log_widget = scrolledtext.ScrolledText(self.notebook, wrap="word", font=("Consolas", 9))
-            log_widget.tag_config("highlight", background="yellow", foreground="black")
-            log_widget.tag_config("error", foreground="red")
-            log_widget.tag_config("warning", foreground="orange")
-            self.notebook.add(log_widget, text=label)
-            self.log_tabs[tag] = log_widget
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=label)
+            self._tab_tags[str(frame)] = tag
+            self._log_frames[tag] = frame
+        self._ensure_tab("All")
+        # Log lines from any thread are queued and moved into the tabs in batches
+        self._log_queue = queue.SimpleQueue()
+        self.after(LOG_DRAIN_MS, self._drain_log_queue)
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._current_log_tab())
 
         self.controller = StackController(
             self.append_log, 
@@ -1428,48 +2102,66 @@ class App(tk.Tk):
         self._setup_shortcuts()
     
     def _setup_shortcuts(self):
-        """Setup keyboard shortcuts."""
-        self.bind('<Control-b>', lambda e: self.start_backend())
-        self.bind('<Control-f>', lambda e: self.start_frontend())
-        self.bind('<Control-a>', lambda e: self.start_all())
-        self.bind('<Control-q>', lambda e: self.stop_all())
-        self.bind('<Control-m>', lambda e: self.run_migrations())
-        self.bind('<Control-d>', lambda e: self.open_django_shell())
-        self.bind('<Control-g>', lambda e: self.show_git_status())
-        self.bind('<Control-i>', lambda e: self.analyze_system())
-        self.bind('<Control-k>', lambda e: self.monitor_celery_queues())
-        self.bind('<Control-i>', lambda e: self.analyze_system())
+        """Setup keyboard shortcuts: one Ctrl+key binding dispatching through a table."""
+        self._shortcuts = {
+            'b': self.start_backend,
+            'f': self.start_frontend,
+            'a': self.start_all,
+            'q': self.stop_all,
+            'm': self.run_migrations,
+            'd': self.open_django_shell,
+            'g': self.show_git_status,
+            'i': self.analyze_system,
+        }
+        self.bind('<Control-KeyPress>', self._on_shortcut)
+    
+    def _on_shortcut(self, event):
+        handler = self._shortcuts.get(event.keysym.lower())
+        if handler:
+            handler()
     
     def _start_resource_monitoring(self):
         """Start background thread to update resource usage."""
+        if not HAS_PSUTIL:
+            return  # nothing to show
+        
         def monitor():
+            shown = {}  # key -> (text, color) currently on the label
+            interval = 2.0
+            psutil.cpu_percent(interval=None)  # prime: later calls measure since the previous one
             while True:
-                time.sleep(2)
-                if not HAS_PSUTIL:
-                    continue
+                # Back off while nothing runs; a status change (update_status) wakes us early
+                if self._resource_wake.wait(interval):
+                    self._resource_wake.clear()
                 
-                with self.controller.lock:
-                    for key, proc in self.controller.procs.items():
-                        if key in self.resource_labels:
-                            usage = proc.get_resource_usage()
-                            if usage:
-                                text = f"CPU: {usage['cpu']:.1f}%  RAM: {usage['memory']:.0f} MB"
-                                color = "green" if usage['cpu'] < 50 else "orange" if usage['cpu'] < 80 else "red"
-                            else:
-                                text = "--"
-                                color = "gray"
-                            
-                            self.after(0, lambda k=key, t=text, c=color: self._update_resource_label(k, t, c))
+                self._system_cpu = psutil.cpu_percent(interval=None)
+                updates = {}
+                usages = self.controller.snapshot_usage()
+                interval = 2.0 if any(usages.values()) else min(interval * 2, 10.0)
+                for key, usage in usages.items():
+                    if key in self.resource_labels:
+                        if usage:
+                            label = _usage_label(round(usage['cpu'], 1), round(usage['memory']))
+                        else:
+                            label = _IDLE_USAGE_LABEL
+                        if shown.get(key) != label:
+                            updates[key] = shown[key] = label
+                
+                # One hop to the Tk thread per tick, and none when nothing changed
+                if updates:
+                    self.after(0, self._apply_resource_updates, updates)
         
         threading.Thread(target=monitor, daemon=True).start()
     
-    def _update_resource_label(self, key, text, color):
-        """Update resource label in UI thread."""
-        if key in self.resource_labels:
-            self.resource_labels[key].config(text=text, foreground=color)
+    def _apply_resource_updates(self, updates):
+        """Update resource labels in UI thread; updates maps key -> (text, color)."""
+        for key, (text, color) in updates.items():
+            if key in self.resource_labels:
+                self.resource_labels[key].config(text=text, foreground=color)
     
     def update_status(self, service_key, status):
         """Update status indicator for a service."""
+        self._resource_wake.set()
         if service_key not in self.status_indicators:
             return
         
@@ -1492,16 +2184,50 @@ class App(tk.Tk):
                 script = f'display notification "{message}" with title "{icon_emoji} LaunchPad"'
                 subprocess.Popen(["osascript", "-e", script], 
                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
+            except OSError:
                 pass
         elif not IS_WINDOWS:
+            icon = {"success": "dialog-information", "error": "dialog-error", "warning": "dialog-warning"}.get(msg_type, "dialog-information")
+            if HAS_JEEPNEY and self._notify_dbus(icon, message):
+                return
             # Linux with notify-send
             try:
-                icon = {"success": "dialog-information", "error": "dialog-error", "warning": "dialog-warning"}.get(msg_type, "dialog-information")
                 subprocess.Popen(["notify-send", "-i", icon, "LaunchPad", message], 
                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
+            except OSError:
                 pass
+    
+    def _notify_dbus(self, icon, message):
+        """Send a notification over one reused session-bus connection; False if that isn't possible."""
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.wrappers import unwrap_msg, DBusErrorResponse
+        from jeepney.io.blocking import open_dbus_connection
+        
+        with self._notify_lock:
+            if self._notify_bus is None:
+                try:
+                    self._notify_bus = open_dbus_connection("SESSION")
+                except Exception:
+                    self._notify_bus = False  # no session bus: stick to notify-send
+            if not self._notify_bus:
+                return False
+            
+            addr = DBusAddress("/org/freedesktop/Notifications",
+                               bus_name="org.freedesktop.Notifications",
+                               interface="org.freedesktop.Notifications")
+            # app_name, replaces_id, icon, summary, body, actions, hints, expire_timeout
+            msg = new_method_call(addr, "Notify", "susssasa{sv}i",
+                                  ("LaunchPad", 0, icon, "LaunchPad", message, [], {}, -1))
+            try:
+                unwrap_msg(self._notify_bus.send_and_get_reply(msg, timeout=2))
+                return True
+            except DBusErrorResponse:
+                return False  # e.g. no notification daemon; the bus itself is fine
+            except Exception:
+                # Drop the connection; the next notification reconnects
+                self._notify_bus.close()
+                self._notify_bus = None
+                return False
 
     def open_config(self):
         def on_save(new_cfg: Paths):
@@ -1536,15 +2262,12 @@ class App(tk.Tk):
                         continue
                 self.append_log("Could not find terminal application")
             else:
-                # Linux - Try different terminal emulators
-                for term in ['gnome-terminal', 'xterm', 'konsole', 'xfce4-terminal']:
-                    try:
-                        subprocess.Popen([term, '--', 'bash', '-c', cmd])
-                        self.append_log("Django shell opened in new terminal")
-                        return
-                    except FileNotFoundError:
-                        continue
-                self.append_log("Could not find terminal emulator")
+                term = _find_terminal()
+                if term is None:
+                    self.append_log("Could not find terminal emulator")
+                    return
+                subprocess.Popen([term, '--', 'bash', '-c', cmd])
+                self.append_log("Django shell opened in new terminal")
         except Exception as e:
             self.append_log(f"Error opening Django shell: {e}")
     
@@ -1557,38 +2280,58 @@ class App(tk.Tk):
         text = scrolledtext.ScrolledText(dialog, wrap="word", font=("Consolas", 10))
         text.pack(fill="both", expand=True, padx=10, pady=10)
         
-        def run_git_command(cmd, title):
-            try:
-                result = subprocess.run(
-                    cmd, 
-                    cwd=self.cfg.PROJECT_ROOT, 
-                    capture_output=True, 
-                    text=True, 
-                    shell=True
-                )
-                text.insert("end", f"\n{'='*60}\n{title}\n{'='*60}\n")
-                text.insert("end", result.stdout if result.stdout else "(no output)\n")
-                if result.stderr:
-                    text.insert("end", f"\nErrors:\n{result.stderr}\n")
-            except Exception as e:
-                text.insert("end", f"Error running {title}: {e}\n")
+        def run_git_commands(*commands):
+            """Run (cmd, title) pairs in PROJECT_ROOT side by side; return their report sections in order."""
+            started = []
+            for cmd, title in commands:
+                try:
+                    p = subprocess.Popen(
+                        cmd, 
+                        cwd=self.cfg.PROJECT_ROOT, 
+                        stdout=subprocess.PIPE, 
+                        stderr=subprocess.PIPE, 
+                        text=True, 
+                        shell=True
+                    )
+                except Exception as e:
+                    p = e
+                started.append((title, p))
+            
+            sections = []
+            for title, p in started:
+                if isinstance(p, Exception):
+                    sections.append(f"Error running {title}: {p}\n")
+                    continue
+                stdout, stderr = p.communicate()
+                section = f"\n{'='*60}\n{title}\n{'='*60}\n"
+                section += stdout if stdout else "(no output)\n"
+                if stderr:
+                    section += f"\nErrors:\n{stderr}\n"
+                sections.append(section)
+            return "".join(sections)
+        
+        def show(content, replace=False):
+            if text.winfo_exists():  # dialog may have been closed meanwhile
+                self._write_report(text, content, replace)
+        
+        def run(*commands, replace=False):
+            # git can take a while (network for pull/push): wait off the UI thread
+            self._run_in_background(lambda: run_git_commands(*commands),
+                                    lambda content: show(content, replace))
         
         def refresh():
-            text.delete("1.0", "end")
-            run_git_command("git branch --show-current", "Current Branch")
-            run_git_command("git status --short", "Status")
-            run_git_command("git log --oneline -5", "Recent Commits")
-            text.config(state="disabled")
+            run(
+                ("git branch --show-current", "Current Branch"),
+                ("git status --short", "Status"),
+                ("git log --oneline -5", "Recent Commits"),
+                replace=True,
+            )
         
         def git_pull():
-            text.config(state="normal")
-            run_git_command("git pull", "Git Pull")
-            text.config(state="disabled")
+            run(("git pull", "Git Pull"))
         
         def git_push():
-            text.config(state="normal")
-            run_git_command("git push", "Git Push")
-            text.config(state="disabled")
+            run(("git push", "Git Push"))
         
         # Buttons
         btn_frame = ttk.Frame(dialog)
@@ -1602,6 +2345,43 @@ class App(tk.Tk):
         refresh()
         dialog.grab_set()
     
+    def _run_in_background(self, work, on_done, poll_ms=50):
+        """Run work() on a daemon thread and pass its result to on_done() on the Tk thread.
+
+        The worker only sets an Event; the Tk side polls it with after(), so the
+        worker thread never calls into Tk.
+        """
+        done = threading.Event()
+        result = []
+        
+        def run():
+            try:
+                result.append(work())
+            finally:
+                done.set()
+        
+        def check():
+            if not done.is_set():
+                self.after(poll_ms, check)
+            elif result:
+                on_done(result[0])
+        
+        threading.Thread(target=run, daemon=True).start()
+        self.after(poll_ms, check)
+    
+    @staticmethod
+    def _write_report(widget, content, replace=True):
+        """Put content into a read-only report Text with a single insert/replace.
+
+        Tk lays the widget out lazily at idle time, so one bulk write costs one reflow.
+        """
+        widget.config(state="normal")
+        if replace:
+            widget.replace("1.0", "end", content)
+        else:
+            widget.insert("end", content)
+        widget.config(state="disabled")
+    
     def view_db_config(self):
         """Display current configuration from database in a dialog."""
         dialog = tk.Toplevel(self)
@@ -1622,32 +2402,21 @@ class App(tk.Tk):
         text = scrolledtext.ScrolledText(text_frame, wrap="none", font=("Consolas", 10))
         text.pack(fill="both", expand=True)
         
-        # Load and display config from database
+        # Load and display config from database; export reuses the decoded values
+        data = None
         try:
-            conn = sqlite3.connect(CONFIG_DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("SELECT key, value FROM config ORDER BY key")
-            rows = cursor.fetchall()
-            conn.close()
+            data = ConfigManager._decode_rows(self.cfg_mgr.read_rows())
             
-            text.insert("end", f"{'Key':<30} | Value\n")
-            text.insert("end", f"{'-'*30}-+-{'-'*60}\n")
-            
-            for key, value in rows:
-                try:
-                    parsed_value = json.loads(value)
-                    if isinstance(parsed_value, str):
-                        display_value = parsed_value
-                    else:
-                        display_value = json.dumps(parsed_value)
-                except:
-                    display_value = str(value)
-                
-                text.insert("end", f"{key:<30} | {display_value}\n")
+            lines = [f"{'Key':<30} | Value\n", f"{'-'*30}-+-{'-'*60}\n"]
+            lines += [
+                f"{key:<30} | {value if isinstance(value, str) else _json_dumps(value)}\n"
+                for key, value in data.items()
+            ]
             
-            text.insert("end", f"\n{'='*90}\n")
-            text.insert("end", f"Total entries: {len(rows)}\n")
-            text.insert("end", f"Database location: {CONFIG_DB_PATH}\n")
+            lines.append(f"\n{'='*90}\n")
+            lines.append(f"Total entries: {len(data)}\n")
+            lines.append(f"Database location: {CONFIG_DB_PATH}\n")
+            text.insert("end", "".join(lines))
             
         except Exception as e:
             text.insert("end", f"Error reading database: {e}\n")
@@ -1668,14 +2437,10 @@ class App(tk.Tk):
             )
             if filepath:
                 try:
-                    conn = sqlite3.connect(CONFIG_DB_PATH)
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT key, value FROM config")
-                    data = {key: json.loads(value) for key, value in cursor.fetchall()}
-                    conn.close()
+                    values = data if data is not None else ConfigManager._decode_rows(self.cfg_mgr.read_rows())
                     
-                    with open(filepath, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    with open(filepath, 'wb') as f:
+                        f.write(_json_dumps_pretty(values))
                     messagebox.showinfo("Success", f"Configuration exported to:\n{filepath}")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to export config:\n{e}")
@@ -1686,6 +2451,23 @@ class App(tk.Tk):
         dialog.grab_set()
         dialog.focus()
     
+    def _ensure_tab(self, tag):
+        """Return the log widget for tag, building it on first use (None for unknown tags)."""
+        widget = self.log_tabs.get(tag)
+        if widget is None and tag in self._log_frames:
+            widget = scrolledtext.ScrolledText(self._log_frames[tag], wrap="word", font=("Consolas", 9))
+            widget.tag_config("highlight", background="yellow", foreground="black")
+            widget.tag_config("error", foreground="red")
+            widget.tag_config("warning", foreground="orange")
+            widget.pack(fill="both", expand=True)
+            self.log_tabs[tag] = widget
+        return widget
+
+    def _current_log_tab(self):
+        """(tag, widget) of the selected log tab."""
+        tag = self._tab_tags[str(self.notebook.select())]
+        return tag, self._ensure_tab(tag)
+
     def search_logs(self):
         """Search for text in current log tab and highlight results."""
         search_text = self.search_var.get()
@@ -1693,30 +2475,26 @@ class App(tk.Tk):
             return
         
         # Get current tab
-        current_tab_idx = self.notebook.index(self.notebook.select())
-        current_widget = list(self.log_tabs.values())[current_tab_idx]
+        _, current_widget = self._current_log_tab()
         
         # Clear previous highlights
         current_widget.tag_remove("highlight", "1.0", "end")
         
-        # Search and highlight
-        start_pos = "1.0"
-        count = 0
-        while True:
-            start_pos = current_widget.search(search_text, start_pos, stopindex="end", nocase=True)
-            if not start_pos:
-                break
-            end_pos = f"{start_pos}+{len(search_text)}c"
-            current_widget.tag_add("highlight", start_pos, end_pos)
-            start_pos = end_pos
-            count += 1
+        # Search and highlight: one Tk search returns every (non-overlapping) match,
+        # in Tk's own indices so emoji earlier on a line can't shift them
+        starts = [str(i) for i in current_widget.tk.splitlist(current_widget.tk.call(
+            current_widget._w, "search", "-all", "-nocase", "--", search_text, "1.0", "end"))]
+        count = len(starts)
         
         if count > 0:
+            length = len(search_text)
+            ranges = []
+            for start in starts:
+                ranges += (start, f"{start}+{length}c")
+            current_widget.tag_add("highlight", *ranges)
             self.append_log(f"Found {count} matches for '{search_text}'")
             # Scroll to first match
-            first_match = current_widget.search(search_text, "1.0", stopindex="end", nocase=True)
-            if first_match:
-                current_widget.see(first_match)
+            current_widget.see(starts[0])
         else:
             self.append_log(f"No matches found for '{search_text}'")
     
@@ -1730,9 +2508,7 @@ class App(tk.Tk):
         """Export current tab's logs to a file."""
         from tkinter import filedialog
         
-        current_tab_idx = self.notebook.index(self.notebook.select())
-        current_name = list(self.log_tabs.keys())[current_tab_idx]
-        current_widget = list(self.log_tabs.values())[current_tab_idx]
+        current_name, current_widget = self._current_log_tab()
         
         filepath = filedialog.asksaveasfilename(
             defaultextension=".txt",
@@ -1742,32 +2518,23 @@ class App(tk.Tk):
         
         if filepath:
             try:
-                content = current_widget.get("1.0", "end-1c")
-                with open(filepath, 'w') as f:
-                    f.write(f"LaunchPad Logs - {current_name}\n")
-                    f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("=" * 80 + "\n\n")
-                    f.write(content)
+                last_line = int(current_widget.index("end-1c").split(".")[0])
+                with open(filepath, 'w', buffering=1 << 20) as f:
+                    f.write(
+                        f"LaunchPad Logs - {current_name}\n"
+                        f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                        + "=" * 80 + "\n\n"
+                    )
+                    # Copy out in line ranges so a multi-MB log is never held as one string
+                    for start in range(1, last_line + 1, LOG_EXPORT_CHUNK_LINES):
+                        stop = start + LOG_EXPORT_CHUNK_LINES
+                        f.write(current_widget.get(f"{start}.0", f"{stop}.0" if stop <= last_line else "end-1c"))
                 messagebox.showinfo("Success", f"Logs exported to:\n{filepath}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export logs:\n{e}")
 
     def _sanity_check(self, show_dialog=True):
-        missing = []
-        checks = [
-            (self.cfg.PYTHON_EXE, "Python venv"),
-            (self.cfg.CELERY_EXE, "Celery"),
-            (self.cfg.DAPHNE_EXE, "Daphne"),
-            (self.cfg.NPM_EXE, "npm"),
-        ]
-        for p, label in checks:
-            if not os.path.exists(p):
-                missing.append(f"{label} executable not found: {p}")
-
-        pkg_json = os.path.join(self.cfg.FRONTEND_DIR, "package.json")
-        if not os.path.exists(pkg_json):
-            missing.append(f"package.json not found in FRONTEND_DIR: {self.cfg.FRONTEND_DIR}")
-
+        missing = _validate_paths(self.cfg)
         if missing:
             msg = "Config errors:\n" + "\n".join(missing)
             self.append_log(msg)
@@ -1780,19 +2547,48 @@ class App(tk.Tk):
             self.append_log("Sanity checks passed ✅")
 
     def append_log(self, text, tag="All"):
-        """Append log entry to the appropriate tab(s)."""
-        def _do_append():
-            # Always append to "All" tab
-            if "All" in self.log_tabs:
-                self.log_tabs["All"].insert("end", text + "\n")
-                self.log_tabs["All"].see("end")
-            
-            # Also append to service-specific tab if tag matches
-            if tag in self.log_tabs and tag != "All":
-                self.log_tabs[tag].insert("end", text + "\n")
-                self.log_tabs[tag].see("end")
+        """Append log entry to the appropriate tab(s); safe to call from any thread."""
+        self._log_queue.put((text, tag))
+
+    def _drain_log_queue(self):
+        """Tk-thread loop: move queued log lines into the tabs, one insert per tab per pass."""
+        all_lines = []
+        by_tag = {}
+        classify = _LOG_CLASSIFIER.search
+        try:
+            for _ in range(LOG_DRAIN_BATCH):
+                text, tag = self._log_queue.get_nowait()
+                m = classify(text)
+                line = (text, _LOG_LINE_TAGS[m and m.lastindex])
+                all_lines.append(line)
+                if tag != "All":
+                    by_tag.setdefault(tag, []).append(line)
+        except queue.Empty:
+            pass
         
-        self.after(0, _do_append)
+        if all_lines:
+            # Always append to "All" tab, and to the service's own tab if it has one
+            self._insert_lines(self.log_tabs["All"], all_lines)
+            for tag, lines in by_tag.items():
+                widget = self._ensure_tab(tag)
+                if widget is not None:
+                    self._insert_lines(widget, lines)
+        self.after(LOG_DRAIN_MS, self._drain_log_queue)
+
+    @staticmethod
+    def _insert_lines(widget, lines):
+        """Insert (text, text_tags) lines with one Tk call; same-coloured neighbours share a chunk."""
+        args = []
+        run, run_tags = [], ()
+        for text, tags in lines:
+            if tags != run_tags and run:
+                args += ("\n".join(run) + "\n", run_tags)
+                run = []
+            run_tags = tags
+            run.append(text)
+        args += ("\n".join(run) + "\n", run_tags)
+        widget.insert("end", *args)
+        widget.see("end")
 
     def run_migrations(self):
         threading.Thread(target=self.controller.migrate_db, daemon=True).start()
@@ -1809,6 +2605,54 @@ class App(tk.Tk):
     def stop_all(self):
         threading.Thread(target=self.controller.stop_all, daemon=True).start()
     
+    def _docker_info(self, ttl=5.0):
+        """Parsed ``docker info`` for the configured Docker, or None if it isn't answering.
+
+        Reused for ``ttl`` seconds so reopening or refreshing the analysis doesn't
+        shell out to Docker every time.
+        """
+        docker = self.cfg.DOCKER_EXE
+        cached = self._docker_info_cache
+        now = time.monotonic()
+        if cached and cached[1] == docker and now - cached[0] < ttl:
+            return cached[2]
+        if HAS_DOCKER_SDK and self._docker_client is not False and _docker_sdk_matches_cli(docker):
+            info = self._docker_sdk_info(docker)
+        else:
+            info = self._docker_cli_info(docker)
+        self._docker_info_cache = (now, docker, info)
+        return info
+    
+    @staticmethod
+    def _docker_cli_info(docker):
+        result = subprocess.run(
+            [docker, "info", "--format", "{{json .}}"],
+            capture_output=True,
+            timeout=5
+        )
+        return _json_loads(result.stdout) if result.returncode == 0 else None
+    
+    def _docker_sdk_info(self, docker):
+        """``docker info`` over the SDK's persistent daemon connection.
+
+        Only used when it reaches the same daemon as the CLI, so a daemon that
+        doesn't answer here isn't asked again through the CLI.
+        """
+        if self._docker_client is None:
+            try:
+                import docker as docker_sdk  # type: ignore
+            except ImportError:
+                self._docker_client = False  # broken install: stick to the CLI
+                return self._docker_cli_info(docker)
+            try:
+                self._docker_client = docker_sdk.from_env(timeout=5)
+            except Exception:
+                return None  # daemon not reachable (yet); try again next time
+        try:
+            return self._docker_client.info()
+        except Exception:
+            return None  # daemon down or unreachable right now
+    
     def analyze_system(self):
         """Analyze system resources and recommend optimal configurations."""
         dialog = tk.Toplevel(self)
@@ -1818,95 +2662,97 @@ class App(tk.Tk):
         text = scrolledtext.ScrolledText(dialog, wrap="word", font=("Consolas", 10), bg="#f5f5f5")
         text.pack(fill="both", expand=True, padx=10, pady=10)
         
-        def analyze():
-            text.delete(1.0, "end")
-            text.insert("end", "="*80 + "\n")
-            text.insert("end", "LAUNCHPAD - SYSTEM ANALYSIS\n")
-            text.insert("end", "="*80 + "\n\n")
+        def collect(w):
+            """Write the report through w(); runs off the Tk thread."""
+            w("="*80 + "\n")
+            w("LAUNCHPAD - SYSTEM ANALYSIS\n")
+            w("="*80 + "\n\n")
             
             if not HAS_PSUTIL:
-                text.insert("end", "⚠️  psutil not available - limited analysis\n\n")
+                w("⚠️  psutil not available - limited analysis\n\n")
                 return
             
             # 1. CPU Analysis
-            text.insert("end", "🖥️  CPU ANALYSIS\n")
-            text.insert("end", "-" * 80 + "\n")
-            cpu_count = psutil.cpu_count(logical=False) or psutil.cpu_count()
-            cpu_logical = psutil.cpu_count(logical=True)
-            cpu_percent = psutil.cpu_percent(interval=1, percpu=False)
+            w("🖥️  CPU ANALYSIS\n")
+            w("-" * 80 + "\n")
+            cpu_count, cpu_logical = _host_cpu_counts()
+            # Latest reading from the resource monitor; only sample here if there is none yet
+            cpu_percent = self._system_cpu
+            if cpu_percent is None:
+                cpu_percent = psutil.cpu_percent(interval=0.5)
             
-            text.insert("end", f"Physical Cores: {cpu_count}\n")
-            text.insert("end", f"Logical Cores: {cpu_logical}\n")
-            text.insert("end", f"Current Usage: {cpu_percent}%\n")
+            w(f"Physical Cores: {cpu_count}\n")
+            w(f"Logical Cores: {cpu_logical}\n")
+            w(f"Current Usage: {cpu_percent}%\n")
             
             # CPU Recommendations
-            text.insert("end", "\n📊 Recommendations:\n")
+            w("\n📊 Recommendations:\n")
             recommended_celery_workers = max(1, cpu_count - 1) if cpu_count > 2 else 1
             recommended_docker_cpu = min(2.0, cpu_count * 0.5)
             
-            text.insert("end", f"  • Celery concurrency: {recommended_celery_workers} workers\n")
-            text.insert("end", f"  • Docker CPU limit: {recommended_docker_cpu} cores\n")
+            w(f"  • Celery concurrency: {recommended_celery_workers} workers\n")
+            w(f"  • Docker CPU limit: {recommended_docker_cpu} cores\n")
             if cpu_count >= 4:
-                text.insert("end", "  • Consider 'threads' or 'eventlet' pool for better parallelism\n")
+                w("  • Consider 'threads' or 'eventlet' pool for better parallelism\n")
             else:
-                text.insert("end", "  • Use 'solo' pool for single-core efficiency\n")
+                w("  • Use 'solo' pool for single-core efficiency\n")
             
             # 2. Memory Analysis
-            text.insert("end", "\n💾 MEMORY ANALYSIS\n")
-            text.insert("end", "-" * 80 + "\n")
+            w("\n💾 MEMORY ANALYSIS\n")
+            w("-" * 80 + "\n")
             mem = psutil.virtual_memory()
             swap = psutil.swap_memory()
             
-            text.insert("end", f"Total RAM: {mem.total / (1024**3):.2f} GB\n")
-            text.insert("end", f"Available: {mem.available / (1024**3):.2f} GB ({mem.percent}% used)\n")
-            text.insert("end", f"Swap: {swap.total / (1024**3):.2f} GB ({swap.percent}% used)\n")
+            w(f"Total RAM: {mem.total / (1024**3):.2f} GB\n")
+            w(f"Available: {mem.available / (1024**3):.2f} GB ({mem.percent}% used)\n")
+            w(f"Swap: {swap.total / (1024**3):.2f} GB ({swap.percent}% used)\n")
             
             # Memory Recommendations
-            text.insert("end", "\n📊 Recommendations:\n")
+            w("\n📊 Recommendations:\n")
             total_gb = mem.total / (1024**3)
             
             if total_gb < 4:
                 docker_mem = "256m"
-                text.insert("end", f"  ⚠️  Low memory system (< 4GB)\n")
-                text.insert("end", f"  • Docker memory limit: {docker_mem}\n")
-                text.insert("end", "  • Use 'solo' Celery pool to minimize memory\n")
-                text.insert("end", "  • Consider running only essential services\n")
+                w(f"  ⚠️  Low memory system (< 4GB)\n")
+                w(f"  • Docker memory limit: {docker_mem}\n")
+                w("  • Use 'solo' Celery pool to minimize memory\n")
+                w("  • Consider running only essential services\n")
             elif total_gb < 8:
                 docker_mem = "512m"
-                text.insert("end", f"  • Docker memory limit: {docker_mem}\n")
-                text.insert("end", "  • Keep Celery concurrency <= 2\n")
+                w(f"  • Docker memory limit: {docker_mem}\n")
+                w("  • Keep Celery concurrency <= 2\n")
             elif total_gb < 16:
                 docker_mem = "1g"
-                text.insert("end", f"  • Docker memory limit: {docker_mem}\n")
-                text.insert("end", "  • Can run full stack comfortably\n")
+                w(f"  • Docker memory limit: {docker_mem}\n")
+                w("  • Can run full stack comfortably\n")
             else:
                 docker_mem = "2g"
-                text.insert("end", f"  ✅ Excellent memory (>= 16GB)\n")
-                text.insert("end", f"  • Docker memory limit: {docker_mem}\n")
-                text.insert("end", "  • Can run multiple instances or heavy workloads\n")
+                w(f"  ✅ Excellent memory (>= 16GB)\n")
+                w(f"  • Docker memory limit: {docker_mem}\n")
+                w("  • Can run multiple instances or heavy workloads\n")
             
             # 3. Disk Analysis
-            text.insert("end", "\n💿 DISK ANALYSIS\n")
-            text.insert("end", "-" * 80 + "\n")
+            w("\n💿 DISK ANALYSIS\n")
+            w("-" * 80 + "\n")
             try:
                 disk = psutil.disk_usage('/')
-                text.insert("end", f"Total: {disk.total / (1024**3):.2f} GB\n")
-                text.insert("end", f"Used: {disk.used / (1024**3):.2f} GB ({disk.percent}%)\n")
-                text.insert("end", f"Free: {disk.free / (1024**3):.2f} GB\n")
+                w(f"Total: {disk.total / (1024**3):.2f} GB\n")
+                w(f"Used: {disk.used / (1024**3):.2f} GB ({disk.percent}%)\n")
+                w(f"Free: {disk.free / (1024**3):.2f} GB\n")
                 
-                text.insert("end", "\n📊 Recommendations:\n")
+                w("\n📊 Recommendations:\n")
                 if disk.percent > 90:
-                    text.insert("end", "  ⚠️  Disk almost full - clean up space!\n")
+                    w("  ⚠️  Disk almost full - clean up space!\n")
                 elif disk.percent > 80:
-                    text.insert("end", "  ⚠️  Disk usage high - monitor space\n")
+                    w("  ⚠️  Disk usage high - monitor space\n")
                 else:
-                    text.insert("end", "  ✅ Adequate disk space\n")
+                    w("  ✅ Adequate disk space\n")
             except Exception as e:
-                text.insert("end", f"Could not analyze disk: {e}\n")
+                w(f"Could not analyze disk: {e}\n")
             
             # 4. Network Analysis
-            text.insert("end", "\n🌐 NETWORK ANALYSIS\n")
-            text.insert("end", "-" * 80 + "\n")
+            w("\n🌐 NETWORK ANALYSIS\n")
+            w("-" * 80 + "\n")
             
             # Check port availability
             ports_to_check = [
@@ -1915,105 +2761,115 @@ class App(tk.Tk):
                 (int(self.cfg.REDIS_PORT), "Redis"),
             ]
             
-            port_status = []
-            for port, service in ports_to_check:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.5)
-                    result = sock.connect_ex(('127.0.0.1', port))
-                    sock.close()
-                    if result == 0:
-                        port_status.append((port, service, "IN USE ⚠️"))
-                    else:
-                        port_status.append((port, service, "AVAILABLE ✅"))
-                except:
-                    port_status.append((port, service, "UNKNOWN"))
+            # Ports with a known listener are in use; only the rest need a connect probe
+            # (the listener scan can come back empty, e.g. without permission on macOS)
+            listening = self.controller._listening_index()
+            states = _probe_ports([port for port, _ in ports_to_check if port not in listening])
+            states.update((port, True) for port, _ in ports_to_check if port in listening)
+            labels = {True: "IN USE ⚠️", False: "AVAILABLE ✅", None: "UNKNOWN"}
+            port_status = [(port, service, labels[states[port]]) for port, service in ports_to_check]
             
             for port, service, status in port_status:
-                text.insert("end", f"Port {port} ({service}): {status}\n")
+                w(f"Port {port} ({service}): {status}\n")
             
-            text.insert("end", "\n📊 Recommendations:\n")
+            w("\n📊 Recommendations:\n")
             in_use = [p for p, s, st in port_status if "IN USE" in st]
             if in_use:
-                text.insert("end", f"  ⚠️  {len(in_use)} port(s) already in use - stop conflicts before starting\n")
+                w(f"  ⚠️  {len(in_use)} port(s) already in use - stop conflicts before starting\n")
             else:
-                text.insert("end", "  ✅ All configured ports are available\n")
+                w("  ✅ All configured ports are available\n")
             
             # 5. Running Processes
-            text.insert("end", "\n⚙️  ACTIVE STACK PROCESSES\n")
-            text.insert("end", "-" * 80 + "\n")
+            w("\n⚙️  ACTIVE STACK PROCESSES\n")
+            w("-" * 80 + "\n")
             
-            active_services = {}
+            # Two-shot sampling over the processes' shared psutil handles: start every
+            # CPU window, sleep once, read them all, so N services cost one 0.1 s wait
+            self.controller.snapshot_usage()
+            time.sleep(0.1)
+            usages = self.controller.snapshot_usage()
+            running = 0
+            total_mem = 0
             for name, proc in self.controller.procs.items():
                 if proc.p and proc.p.poll() is None:
-                    try:
-                        p = psutil.Process(proc.p.pid)
-                        mem_mb = p.memory_info().rss / (1024**2)
-                        cpu = p.cpu_percent(interval=0.1)
-                        active_services[name] = (p.pid, mem_mb, cpu)
-                    except:
-                        active_services[name] = (proc.p.pid, 0, 0)
-            
-            if active_services:
-                total_mem = 0
-                for name, (pid, mem_mb, cpu) in active_services.items():
-                    text.insert("end", f"{name}: PID {pid}, RAM {mem_mb:.1f}MB, CPU {cpu:.1f}%\n")
+                    usage = usages.get(name)
+                    mem_mb, cpu = (usage['memory'], usage['cpu']) if usage else (0, 0)
+                    w(f"{name}: PID {proc.p.pid}, RAM {mem_mb:.1f}MB, CPU {cpu:.1f}%\n")
                     total_mem += mem_mb
-                text.insert("end", f"\nTotal Stack Memory: {total_mem:.1f} MB\n")
+                    running += 1
+            
+            if running:
+                w(f"\nTotal Stack Memory: {total_mem:.1f} MB\n")
             else:
-                text.insert("end", "No services currently running\n")
+                w("No services currently running\n")
             
             # 6. Docker Analysis
-            text.insert("end", "\n🐳 DOCKER ANALYSIS\n")
-            text.insert("end", "-" * 80 + "\n")
+            w("\n🐳 DOCKER ANALYSIS\n")
+            w("-" * 80 + "\n")
             
             try:
-                result = subprocess.run(
-                    [self.cfg.DOCKER_EXE, "info", "--format", "{{json .}}"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    docker_info = json.loads(result.stdout)
-                    text.insert("end", f"Docker Version: {docker_info.get('ServerVersion', 'Unknown')}\n")
-                    text.insert("end", f"Running Containers: {docker_info.get('ContainersRunning', 0)}\n")
-                    text.insert("end", f"Total Containers: {docker_info.get('Containers', 0)}\n")
-                    text.insert("end", f"Images: {docker_info.get('Images', 0)}\n")
+                docker_info = self._docker_info()
+                if docker_info is not None:
+                    w(f"Docker Version: {docker_info.get('ServerVersion', 'Unknown')}\n")
+                    w(f"Running Containers: {docker_info.get('ContainersRunning', 0)}\n")
+                    w(f"Total Containers: {docker_info.get('Containers', 0)}\n")
+                    w(f"Images: {docker_info.get('Images', 0)}\n")
                     
                     mem_limit = docker_info.get('MemTotal', 0)
                     if mem_limit:
-                        text.insert("end", f"Docker Memory: {mem_limit / (1024**3):.2f} GB\n")
+                        w(f"Docker Memory: {mem_limit / (1024**3):.2f} GB\n")
                 else:
-                    text.insert("end", "⚠️  Docker not responding or not installed\n")
+                    w("⚠️  Docker not responding or not installed\n")
             except Exception as e:
-                text.insert("end", f"⚠️  Could not connect to Docker: {e}\n")
+                w(f"⚠️  Could not connect to Docker: {e}\n")
             
             # 7. Overall Recommendation
-            text.insert("end", "\n" + "="*80 + "\n")
-            text.insert("end", "💡 RECOMMENDED CONFIGURATION\n")
-            text.insert("end", "="*80 + "\n")
-            
-            text.insert("end", f"Celery Pool: {'threads' if cpu_count >= 4 else 'solo'}\n")
-            text.insert("end", f"Celery Concurrency: {recommended_celery_workers}\n")
-            text.insert("end", f"Docker Memory Limit: {docker_mem}\n")
-            text.insert("end", f"Docker CPU Limit: {recommended_docker_cpu}\n")
+            rule = "=" * 80 + "\n"
+            w(
+                "\n" + rule + "💡 RECOMMENDED CONFIGURATION\n" + rule +
+                f"Celery Pool: {'threads' if cpu_count >= 4 else 'solo'}\n"
+                f"Celery Concurrency: {recommended_celery_workers}\n"
+                f"Docker Memory Limit: {docker_mem}\n"
+                f"Docker CPU Limit: {recommended_docker_cpu}\n"
+                "\n📝 To apply these settings, go to Settings and update:\n"
+                "  • Celery Pool and Concurrency\n"
+                "  • Docker Memory and CPU limits\n"
+                "\n" + rule
+            )
+        
+        def show(report, busy=False):
+            if text.winfo_exists():  # dialog may have been closed meanwhile
+                self._write_report(text, report)
+                # One run at a time: Refresh stays disabled until the report is in
+                refresh_btn.state(["disabled" if busy else "!disabled"])
+        
+        def analyze():
+            show("Analyzing system…\n", busy=True)
             
-            text.insert("end", "\n📝 To apply these settings, go to Settings and update:\n")
-            text.insert("end", "  • Celery Pool and Concurrency\n")
-            text.insert("end", "  • Docker Memory and CPU limits\n")
+            def work():
+                # Sampling CPU and asking Docker take seconds: keep that off the UI thread,
+                # then hand the finished report to Tk in one insert. A thread rather than a
+                # worker process: collect() reads the controller's live psutil handles and
+                # the App's docker/listener caches, none of which a child process would share
+                out = []
+                try:
+                    collect(out.append)
+                except Exception as e:
+                    out.append(f"\nAnalysis failed: {e}\n")
+                return "".join(out)
             
-            text.insert("end", "\n" + "="*80 + "\n")
-        
-        # Auto-run analysis on dialog open
-        analyze()
+            self._run_in_background(work, show)
         
         btn_frame = ttk.Frame(dialog)
         btn_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Button(btn_frame, text="Refresh", command=analyze).pack(side="left", padx=5)
+        refresh_btn = ttk.Button(btn_frame, text="Refresh", command=analyze)
+        refresh_btn.pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side="right")
         
+        # Auto-run analysis on dialog open
+        analyze()
+        
         dialog.grab_set()
     
     def manage_presets(self):
@@ -2023,8 +2879,9 @@ class App(tk.Tk):
         dialog.geometry("500x400")
         
         try:
-            presets = json.loads(self.cfg.SERVICE_PRESETS)
-        except:
+            presets = _json_loads(self.cfg.SERVICE_PRESETS)
+        except (AttributeError, TypeError, ValueError):
+            # Missing (not a stored setting), not a string, or not valid JSON
             presets = {}
         
         ttk.Label(dialog, text="Service Presets", font=("TkDefaultFont", 12, "bold")).pack(pady=10)
@@ -2032,13 +2889,15 @@ class App(tk.Tk):
         listbox = tk.Listbox(dialog, height=10)
         listbox.pack(fill="both", expand=True, padx=10, pady=10)
         
-        for name in presets.keys():
-            listbox.insert("end", name)
+        listbox.insert("end", *presets)
+        saved = dict(presets)
         
         def save_presets():
-            self.cfg.SERVICE_PRESETS = json.dumps(presets)
-            self.cfg_mgr.save(self.cfg)
-            self._build_preset_menu()
+            # Re-serialize and write only when an entry actually changed
+            if presets != saved:
+                self.cfg.SERVICE_PRESETS = _json_dumps(presets)
+                self.cfg_mgr.save(self.cfg)
+                self._build_preset_menu()
             dialog.destroy()
         
         btn_frame = ttk.Frame(dialog)
@@ -2055,16 +2914,7 @@ class App(tk.Tk):
         
         def build():
             try:
-                result = subprocess.run(
-                    [self.cfg.NPM_EXE, "run", "build"],
-                    cwd=self.cfg.FRONTEND_DIR,
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0:
-                    self.append_log("✅ Frontend build completed successfully")
-                else:
-                    self.append_log(f"❌ Frontend build failed: {result.stderr}")
+                self.controller.build_frontend()
             except Exception as e:
                 self.append_log(f"Error building frontend: {e}")
         
@@ -2081,13 +2931,11 @@ class App(tk.Tk):
             print("System tray icon disabled on macOS (not compatible with tkinter)")
             return None
         
-        # Create a simple icon
-        def create_icon_image():
-            img = Image.new('RGB', (64, 64), color='#2196F3')
-            draw = ImageDraw.Draw(img)
-            draw.rectangle([10, 10, 54, 54], fill='white')
-            draw.text((20, 20), "SC", fill='#2196F3')
-            return img
+        try:
+            from pystray import Icon, Menu, MenuItem  # type: ignore
+            icon_image = _tray_icon_image()
+        except ImportError:
+            return None
         
         def on_show(icon, item):
             self.after(0, self.deiconify)
@@ -2109,7 +2957,7 @@ class App(tk.Tk):
             MenuItem('Quit', on_quit)
         )
         
-        icon = Icon("LaunchPad", create_icon_image(), "LaunchPad", menu)
+        icon = Icon("LaunchPad", icon_image, "LaunchPad", menu)
         
         def run_icon():
             icon.run()
@@ -2119,7 +2967,7 @@ class App(tk.Tk):
     
     def on_minimize(self):
         """Minimize to tray instead of taskbar."""
-        if HAS_TRAY and hasattr(self, 'tray_icon'):
+        if getattr(self, 'tray_icon', None):
             self.withdraw()
         else:
             self.iconify()
@@ -2129,8 +2977,10 @@ class App(tk.Tk):
             self.controller._stop_monitoring = True
             self.controller.stop_all()
         finally:
-            if HAS_TRAY and hasattr(self, 'tray_icon') and self.tray_icon:
+            if getattr(self, 'tray_icon', None):
                 self.tray_icon.stop()
+            if self._notify_bus:
+                self._notify_bus.close()
             self.destroy()
 
 
@@ -2140,8 +2990,12 @@ if __name__ == "__main__":
 
     app = App(cfg, cfg_mgr)
     
-    # Setup tray icon if available
+    # Setup tray icon if available, once the window is up: importing pystray/PIL
+    # shouldn't hold up the first paint
     if HAS_TRAY:
-        app.tray_icon = app.setup_tray_icon()
+        app.after_idle(lambda: setattr(app, "tray_icon", app.setup_tray_icon()))
     
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        cfg_mgr.close()
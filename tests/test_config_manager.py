@@ -0,0 +1,76 @@
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import launchpad  # noqa: E402
+
+
+class UpgradeDbTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "launchpad.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_baseline_db(self, values):
+        """Create a user_version 0 database with every value JSON-encoded."""
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("CREATE TABLE config (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.executemany(
+                "INSERT INTO config (key, value) VALUES (?, ?)",
+                [(k, json.dumps(v)) for k, v in values.items()],
+            )
+        conn.close()
+
+    def _user_version(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_string_values_unwrapped_when_legacy_import_fails(self):
+        self._write_baseline_db({
+            "PROJECT_ROOT": "/srv/project",
+            "DAPHNE_HOST": "127.0.0.1",
+            "DAPHNE_PORT": 9000,
+        })
+        legacy = os.path.join(self.tmp.name, "launchpad.config.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump([1, 2], f)
+
+        paths = launchpad.ConfigManager(self.db_path).load()
+
+        self.assertEqual(paths.PROJECT_ROOT, "/srv/project")
+        self.assertEqual(paths.DAPHNE_HOST, "127.0.0.1")
+        self.assertEqual(paths.DAPHNE_PORT, 9000)
+        # The import is retried on the next load, and values stay unwrapped.
+        self.assertEqual(self._user_version(), 0)
+        self.assertTrue(os.path.exists(legacy))
+        again = launchpad.ConfigManager(self.db_path).load()
+        self.assertEqual(again.PROJECT_ROOT, "/srv/project")
+        self.assertEqual(again.DAPHNE_HOST, "127.0.0.1")
+
+    def test_string_values_unwrapped_after_legacy_import(self):
+        self._write_baseline_db({"PROJECT_ROOT": "/srv/project"})
+        legacy = os.path.join(self.tmp.name, "launchpad.config.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump({"DAPHNE_HOST": "0.0.0.0"}, f)
+
+        paths = launchpad.ConfigManager(self.db_path).load()
+
+        self.assertEqual(paths.PROJECT_ROOT, "/srv/project")
+        self.assertEqual(paths.DAPHNE_HOST, "0.0.0.0")
+        self.assertEqual(self._user_version(), 2)
+        self.assertTrue(os.path.exists(legacy + ".backup"))
+
+
+if __name__ == "__main__":
+    unittest.main()